@@ -4,55 +4,82 @@ from __future__ import annotations
 
 import argparse
 import importlib
-import json
 import sys
 
+from claudit.jsonio import dumps
 
-def main(argv: list[str] | None = None) -> int:
+# Skill name -> (CLI module, top-level help).  Skill modules are only
+# imported once the command is known, so ``claudit --help`` stays cheap.
+SKILLS = {
+    "index": ("claudit.skills.index.cli", "Manage GNU Global indexes"),
+    "graph": ("claudit.skills.graph.cli", "Call graph operations"),
+    "path": ("claudit.skills.path.cli", "Call path operations"),
+    "highlight": (
+        "claudit.skills.highlight.cli",
+        "Syntax-highlighted source with annotations",
+    ),
+    "harness": (
+        "claudit.skills.harness.cli",
+        "Extract code and analyze dependencies for test harnesses",
+    ),
+}
+
+
+def _build_parser(
+    command: str | None = None,
+) -> tuple[argparse.ArgumentParser, argparse.ArgumentParser | None]:
+    """Build the top-level parser.
+
+    Only the skill named by *command* is fully registered; the others get a
+    placeholder subparser so they still appear in help and choices.  Returns
+    the top-level parser and the registered skill parser (None without
+    *command*).
+    """
     parser = argparse.ArgumentParser(
         prog="claudit",
         description="Code auditing skills for Claude Code",
     )
     sub = parser.add_subparsers(dest="command")
 
-    from claudit.skills.index.cli import register as register_index
-    from claudit.skills.graph.cli import register as register_graph
-    from claudit.skills.path.cli import register as register_path
-    from claudit.skills.highlight.cli import register as register_highlight
-    from claudit.skills.harness.cli import register as register_harness
+    skill_parser = None
+    for name, (module, help_text) in SKILLS.items():
+        if name == command:
+            skill_parser = importlib.import_module(module).register(sub)
+        else:
+            sub.add_parser(name, help=help_text, add_help=False)
 
-    register_index(sub)
-    register_graph(sub)
-    register_path(sub)
-    register_highlight(sub)
-    register_harness(sub)
+    return parser, skill_parser
 
-    args = parser.parse_args(argv)
+
+def main(argv: list[str] | None = None) -> int:
+    parser, _ = _build_parser()
+    args, _ = parser.parse_known_args(argv)
 
     if args.command is None:
+        parser.parse_args(argv)  # reject stray arguments
         parser.print_help()
         return 1
 
-    skill_dispatch = {
-        "index": "claudit.skills.index.cli",
-        "graph": "claudit.skills.graph.cli",
-        "path": "claudit.skills.path.cli",
-        "highlight": "claudit.skills.highlight.cli",
-        "harness": "claudit.skills.harness.cli",
-    }
-
-    if args.command in skill_dispatch:
-        if not getattr(args, "action", None):
-            parser.parse_args([args.command, "--help"])
-            return 1
-
-        cli_mod = importlib.import_module(skill_dispatch[args.command])
-        result = cli_mod.run(args)
-        json.dump(result, sys.stdout, indent=2)
-        print()
-        return 0
-
-    return 1
+    parser, skill_parser = _build_parser(args.command)
+    args = parser.parse_args(argv)
+
+    if not getattr(args, "action", None):
+        skill_parser.print_help()
+        return 1
+
+    cli_mod = importlib.import_module(SKILLS[args.command][0])
+    result = cli_mod.run(args)
+    write = sys.stdout.write
+    if isinstance(result, dict):
+        write(dumps(result, pretty=True))
+        write("\n")
+    else:
+        # Records (e.g. ``graph show --jsonl``): one compact object per line.
+        # This is an output format only; the result is already in memory.
+        for record in result:
+            write(dumps(record))
+            write("\n")
+    return 0
 
 
 if __name__ == "__main__":
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+import os
 from pathlib import Path
+from typing import Iterator
 
-from pygments.lexers import CLexer, JavaLexer, PythonLexer
+from claudit.jsonio import loads
 
 
 EXT_MAP = {
@@ -14,22 +18,59 @@ EXT_MAP = {
     ".py": "python",
 }
 
+# "module:attr" specs, resolved on first use by get_lexer_class() so that
+# importing this module does not pull in pygments.lexers.
 LEXER_MAP = {
-    "c": CLexer,
-    "java": JavaLexer,
-    "python": PythonLexer,
+    "c": "pygments.lexers.c_cpp:CLexer",
+    "java": "pygments.lexers.jvm:JavaLexer",
+    "python": "pygments.lexers.python:PythonLexer",
 }
 
+_lexer_classes: dict[str, type] = {}
+
+
+def get_lexer_class(language: str) -> type | None:
+    """Return the Pygments lexer class for *language*, or None if unsupported."""
+    lexer_cls = _lexer_classes.get(language)
+    if lexer_cls is None:
+        spec = LEXER_MAP.get(language)
+        if spec is None:
+            return None
+        module, attr = spec.split(":")
+        lexer_cls = getattr(importlib.import_module(module), attr)
+        _lexer_classes[language] = lexer_cls
+    return lexer_cls
+
 
 def detect_language(project_dir: str) -> str:
-    """Auto-detect the dominant language of a project by file extension counts."""
-    root = Path(project_dir).resolve()
+    """Auto-detect the dominant language of a project by file extension counts.
+
+    Results are memoized per resolved project path for the life of the
+    process.
+    """
+    return _detect_language(str(Path(project_dir).resolve()))
+
+
+# Early exit for detect_language(): every _EARLY_EXIT_EVERY source files,
+# stop walking once the leader has at least _EARLY_EXIT_MIN files and
+# outnumbers the runner-up _EARLY_EXIT_RATIO to one.
+_EARLY_EXIT_EVERY = 4096
+_EARLY_EXIT_MIN = 1024
+_EARLY_EXIT_RATIO = 8
 
+
+@functools.lru_cache(maxsize=32)
+def _detect_language(root: str) -> str:
     counts = {"c": 0, "java": 0, "python": 0}
 
-    for f in root.rglob("*"):
-        if f.is_file() and f.suffix in EXT_MAP:
-            counts[EXT_MAP[f.suffix]] += 1
+    seen = 0
+    for lang in _iter_source_languages(root):
+        counts[lang] += 1
+        seen += 1
+        if seen % _EARLY_EXIT_EVERY == 0:
+            top, second = sorted(counts.values(), reverse=True)[:2]
+            if top >= _EARLY_EXIT_MIN and top > _EARLY_EXIT_RATIO * max(second, 1):
+                break
 
     if max(counts.values()) == 0:
         return "c"  # default
@@ -37,15 +78,52 @@ def detect_language(project_dir: str) -> str:
     return max(counts, key=lambda k: counts[k])
 
 
+def _iter_source_languages(root: str) -> Iterator[str]:
+    """Yield the language of every recognised source file under *root*."""
+    # Explicit scandir walk: DirEntry caches the file type from the dirent,
+    # so no per-file stat or Path allocation is needed.
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                if dot > 0:
+                    lang = EXT_MAP.get(name[dot:])
+                    if lang is not None:
+                        yield lang
+
+
 def load_overrides(path: str | None) -> dict[str, list[str]] | None:
-    """Load manual override edges from a JSON file."""
+    """Load manual override edges from a JSON file.
+
+    Parsed results are memoized on (path, mtime), so edits are picked up.
+    """
     if path is None:
         return None
-    import json
     p = Path(path)
-    if not p.exists():
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
         return None
-    data = json.loads(p.read_text())
+    return _load_overrides(str(p.resolve()), mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_overrides(path: str, mtime_ns: int) -> dict[str, list[str]] | None:
+    data = loads(Path(path).read_bytes())
     if not isinstance(data, dict):
         return None
     return data
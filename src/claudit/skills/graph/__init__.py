@@ -2,7 +2,7 @@
 
 Public API
 ----------
-- build(project_dir, *, language=None, overrides_path=None, force=False) -> dict
+- build(project_dir, *, language=None, overrides_path=None, force=False, jobs=1) -> dict
 - show(project_dir, *, auto_build=True) -> dict
 - callees(project_dir, function, *, auto_build=True) -> dict
 - callers(project_dir, function, *, auto_build=True) -> dict
@@ -10,14 +10,17 @@ Public API
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Any
 
 from claudit.errors import GraphNotFoundError
 from claudit.lang import detect_language, load_overrides
-from claudit.skills.index.indexer import ensure_index
-from claudit.skills.graph.cache import load_call_graph, save_call_graph
-from claudit.skills.graph.callgraph import build_call_graph
+from claudit.skills.index.indexer import ensure_index, resolve_project
+from claudit.skills.graph.cache import (
+    load_call_graph,
+    load_reverse_call_graph,
+    save_call_graph,
+)
+from claudit.skills.graph.callgraph import build_call_graph, reverse_call_graph
 
 
 def _require_graph(project_dir: str, auto_build: bool) -> dict[str, list[str]]:
@@ -38,14 +41,29 @@ def _require_graph(project_dir: str, auto_build: bool) -> dict[str, list[str]]:
     return graph
 
 
+def _require_reverse_graph(
+    project_dir: str, auto_build: bool
+) -> dict[str, list[str]]:
+    """Load the cached callee -> callers index, deriving it if absent."""
+    reverse = load_reverse_call_graph(project_dir)
+    if reverse is not None:
+        return reverse
+    return reverse_call_graph(_require_graph(project_dir, auto_build))
+
+
 def build(
     project_dir: str,
     *,
     language: str | None = None,
     overrides_path: str | None = None,
     force: bool = False,
+    jobs: int = 1,
 ) -> dict[str, Any]:
-    """Build a call graph for the project."""
+    """Build a call graph for the project.
+
+    ``jobs`` sets the number of worker processes used to scan files
+    (0 means one per CPU).
+    """
     ensure_index(project_dir)
 
     if language is None:
@@ -63,10 +81,10 @@ def build(
                 "node_count": len(cached),
                 "edge_count": edge_count,
                 "language": language,
-                "project_dir": str(Path(project_dir).resolve()),
+                "project_dir": str(resolve_project(project_dir)),
             }
 
-    graph = build_call_graph(project_dir, language, overrides=overrides)
+    graph = build_call_graph(project_dir, language, overrides=overrides, jobs=jobs)
     save_call_graph(project_dir, graph)
 
     edge_count = sum(len(v) for v in graph.values())
@@ -75,7 +93,7 @@ def build(
         "node_count": len(graph),
         "edge_count": edge_count,
         "language": language,
-        "project_dir": str(Path(project_dir).resolve()),
+        "project_dir": str(resolve_project(project_dir)),
     }
 
 
@@ -117,10 +135,8 @@ def callers(
     auto_build: bool = True,
 ) -> dict[str, Any]:
     """List direct callers of a function (reverse lookup)."""
-    graph = _require_graph(project_dir, auto_build)
-    caller_list = sorted(
-        caller for caller, targets in graph.items() if function in targets
-    )
+    reverse = _require_reverse_graph(project_dir, auto_build)
+    caller_list = reverse.get(function, [])
     return {
         "function": function,
         "callers": caller_list,
@@ -1,28 +1,34 @@
 """Caching layer for call graph data.
 
-Stores call graph edges in .cache/<project_hash>/ keyed on
-project path + GTAGS mtime.
+Stores call graph edges (and the derived callee -> callers index) in
+.cache/<project_hash>/ keyed on project path + GTAGS mtime.
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import json
+import sys
 from pathlib import Path
 from typing import Any
 
-from claudit.skills.index.indexer import gtags_mtime
+from claudit.jsonio import dumps_bytes, loads
+from claudit.skills.graph.callgraph import reverse_call_graph
+from claudit.skills.index.indexer import gtags_mtime, resolve_project
+
+# Bump when the on-disk call graph layout changes so old caches are rebuilt.
+CALLGRAPH_CACHE_VERSION = 4
 
 
 def _project_hash(project_dir: str) -> str:
     """Deterministic hash for a project path."""
     return hashlib.sha256(
-        Path(project_dir).resolve().as_posix().encode()
+        resolve_project(project_dir).as_posix().encode()
     ).hexdigest()[:16]
 
 
 def _cache_dir(project_dir: str) -> Path:
-    root = Path(project_dir).resolve()
+    root = resolve_project(project_dir)
     return root / ".cache" / _project_hash(project_dir)
 
 
@@ -32,32 +38,79 @@ def _cache_key(project_dir: str) -> str:
     return f"{_project_hash(project_dir)}:{mtime}"
 
 
-def load_call_graph(project_dir: str) -> dict[str, list[str]] | None:
-    """Load cached call graph if it exists and is fresh."""
-    d = _cache_dir(project_dir)
+def _callgraph_meta_fresh(d: Path, project_dir: str) -> bool:
     meta_file = d / "callgraph_meta.json"
-    graph_file = d / "callgraph.json"
-
-    if not meta_file.exists() or not graph_file.exists():
+    if not meta_file.exists():
+        return False
+    meta = loads(meta_file.read_bytes())
+    return (
+        meta.get("key") == _cache_key(project_dir)
+        and meta.get("version") == CALLGRAPH_CACHE_VERSION
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _read_graph(path: str, mtime_ns: int, size: int) -> dict[str, list[str]]:
+    """Parse a graph file; memoized on its (path, mtime, size).
+
+    Names are interned so each function is one string object however many
+    callers list it.
+    """
+    intern = sys.intern
+    return {
+        intern(caller): [intern(c) for c in callees]
+        for caller, callees in loads(Path(path).read_bytes()).items()
+    }
+
+
+def _load_graph_file(
+    graph_file: Path, project_dir: str
+) -> dict[str, list[str]] | None:
+    try:
+        st = graph_file.stat()
+    except OSError:
         return None
-
-    meta = json.loads(meta_file.read_text())
-    if meta.get("key") != _cache_key(project_dir):
+    if not _callgraph_meta_fresh(graph_file.parent, project_dir):
         return None
+    graph = _read_graph(str(graph_file), st.st_mtime_ns, st.st_size)
+    # A fresh dict per call, so callers never share mutable lists
+    return {caller: list(callees) for caller, callees in graph.items()}
+
+
+def load_call_graph(project_dir: str) -> dict[str, list[str]] | None:
+    """Load cached call graph if it exists and is fresh.
+
+    The parsed file is kept in memory, so repeated loads within one process
+    skip the disk read and JSON decode.
+    """
+    return _load_graph_file(_cache_dir(project_dir) / "callgraph.json", project_dir)
+
 
-    return json.loads(graph_file.read_text())
+def load_reverse_call_graph(project_dir: str) -> dict[str, list[str]] | None:
+    """Load the cached callee -> callers index if it exists and is fresh."""
+    return _load_graph_file(
+        _cache_dir(project_dir) / "callgraph_reverse.json", project_dir
+    )
 
 
 def save_call_graph(project_dir: str, graph: dict[str, list[str]]) -> None:
-    """Persist call graph to disk."""
+    """Persist call graph and its reverse index to disk."""
     d = _cache_dir(project_dir)
     d.mkdir(parents=True, exist_ok=True)
 
     meta_file = d / "callgraph_meta.json"
     graph_file = d / "callgraph.json"
+    reverse_file = d / "callgraph_reverse.json"
 
-    meta_file.write_text(json.dumps({"key": _cache_key(project_dir)}))
-    graph_file.write_text(json.dumps(graph))
+    _read_graph.cache_clear()
+    # Path results were computed from the graph being replaced
+    (d / "paths.json").unlink(missing_ok=True)
+    graph_file.write_bytes(dumps_bytes(graph))
+    reverse_file.write_bytes(dumps_bytes(reverse_call_graph(graph)))
+    meta_file.write_bytes(dumps_bytes({
+        "key": _cache_key(project_dir),
+        "version": CALLGRAPH_CACHE_VERSION,
+    }))
 
 
 def load_global_results(project_dir: str) -> dict[str, Any] | None:
@@ -69,11 +122,11 @@ def load_global_results(project_dir: str) -> dict[str, Any] | None:
     if not meta_file.exists() or not results_file.exists():
         return None
 
-    meta = json.loads(meta_file.read_text())
+    meta = loads(meta_file.read_bytes())
     if meta.get("key") != _cache_key(project_dir):
         return None
 
-    return json.loads(results_file.read_text())
+    return loads(results_file.read_bytes())
 
 
 def save_global_results(project_dir: str, results: dict[str, Any]) -> None:
@@ -84,5 +137,72 @@ def save_global_results(project_dir: str, results: dict[str, Any]) -> None:
     meta_file = d / "global_meta.json"
     results_file = d / "global_results.json"
 
-    meta_file.write_text(json.dumps({"key": _cache_key(project_dir)}))
-    results_file.write_text(json.dumps(results))
+    meta_file.write_bytes(dumps_bytes({"key": _cache_key(project_dir)}))
+    results_file.write_bytes(dumps_bytes(results))
+
+
+# Oldest queries are dropped past this many, keeping paths.json bounded
+MAX_CACHED_PATH_QUERIES = 256
+
+
+def _paths_query(source: str, target: str, max_depth: int) -> str:
+    return f"{source}\t{target}\t{max_depth}"
+
+
+def _read_path_queries(d: Path, project_dir: str) -> dict[str, list[list[str]]]:
+    """Return the fresh query -> paths map in *d*; empty if absent or unreadable."""
+    try:
+        doc = loads((d / "paths.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(doc, dict) or doc.get("key") != _cache_key(project_dir):
+        return {}
+    queries = doc.get("queries")
+    return queries if isinstance(queries, dict) else {}
+
+
+def load_paths(
+    project_dir: str, source: str, target: str, max_depth: int
+) -> list[list[str]] | None:
+    """Load cached ``find_all_paths`` results for one query, if fresh.
+
+    Results are keyed like the call graph (project + GTAGS mtime) and are
+    dropped whenever the call graph is saved again.  A missing or damaged
+    file, or no fresh cached graph beside it, is a cache miss.
+    """
+    d = _cache_dir(project_dir)
+    if not _callgraph_meta_fresh(d, project_dir):
+        return None
+    queries = _read_path_queries(d, project_dir)
+    return queries.get(_paths_query(source, target, max_depth))
+
+
+def save_paths(
+    project_dir: str,
+    source: str,
+    target: str,
+    max_depth: int,
+    paths: list[list[str]],
+) -> None:
+    """Persist ``find_all_paths`` results for one query.
+
+    Only done next to a fresh cached call graph, and best effort: a cache
+    directory that cannot be written (e.g. a read-only project) is skipped.
+    """
+    d = _cache_dir(project_dir)
+    if not _callgraph_meta_fresh(d, project_dir):
+        return
+
+    queries = _read_path_queries(d, project_dir)
+    query = _paths_query(source, target, max_depth)
+    queries.pop(query, None)
+    queries[query] = paths
+    for stale in list(queries)[:-MAX_CACHED_PATH_QUERIES]:
+        del queries[stale]
+
+    try:
+        (d / "paths.json").write_bytes(
+            dumps_bytes({"key": _cache_key(project_dir), "queries": queries})
+        )
+    except OSError:
+        pass
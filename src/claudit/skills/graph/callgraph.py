@@ -1,86 +1,191 @@
-"""Call graph construction using GNU Global + Pygments lexers.
+"""Call graph construction using GNU Global + a regex call scanner.
 
-For each function:
-1. Get definition + body bounds via Global
-2. Tokenize body with the appropriate Pygments lexer
-3. Extract function-call tokens
-4. Resolve callees via Global symbol lookup
+1. Get every definition with one Global query
+2. Read function bodies file by file using ctags bounds
+3. Blank out comments and string literals for the body's language
+4. Scan for ``identifier(`` call sites of known symbols
 5. Handle C function pointers and ambiguous calls
 """
 
 from __future__ import annotations
 
+import bisect
 import re
 import subprocess
-import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
 
-from pygments.token import Token
-
-from claudit.lang import LEXER_MAP
+from claudit.jsonio import loads
 from claudit.skills.index.indexer import (
     FunctionDef,
-    find_definition,
-    get_function_body,
+    find_all_definitions,
+    get_function_bodies,
     list_symbols,
+    resolve_project,
+    which,
+)
+
+# Struct field assignment of a bare identifier: .field = func / ->field = func
+_FP_ASSIGN_RE = re.compile(r"(?:->|\.)(\w+)\s*=\s*(\w+)", re.ASCII)
+
+# An identifier immediately followed (modulo whitespace) by an open paren.
+# C identifiers are ASCII, which lets the engine skip Unicode class lookups;
+# Java and Python allow non-ASCII names.
+_CALL_PATTERN = r"([A-Za-z_]\w*)\s*\("
+_CALL_RE = {
+    "c": re.compile(_CALL_PATTERN, re.ASCII),
+    "java": re.compile(_CALL_PATTERN),
+    "python": re.compile(_CALL_PATTERN),
+}
+
+# Comments and string/char literals per language; matches are blanked out
+# before scanning so that calls mentioned in them are not counted.
+_C_LIKE_NOISE = (
+    r"/\*.*?\*/"
+    r"|//[^\n]*"
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
 )
+_NOISE_RE = {
+    # Preprocessor lines run on through backslash continuations
+    "c": re.compile(
+        r"^[ \t]*#(?:\\\n|[^\n])*|" + _C_LIKE_NOISE, re.DOTALL | re.MULTILINE
+    ),
+    "java": re.compile(_C_LIKE_NOISE, re.DOTALL),
+    # Group 1 is a string prefix, so f-strings can be told apart
+    "python": re.compile(
+        r"#[^\n]*"
+        r"|(?:(?<!\w)([rRbBuUfF]{1,2}))?"
+        r'(?:"""(?:\\.|.)*?"""'
+        r"|'''(?:\\.|.)*?'''"
+        r'|"(?:\\.|[^"\\\n])*"'
+        r"|'(?:\\.|[^'\\\n])*')",
+        re.DOTALL,
+    ),
+}
+
+# A replacement field in an f-string, allowing one level of nested braces
+# (as in a ``{value:{width}}`` format spec).  Escaped ``{{``/``}}`` match
+# with an empty group.
+_FSTRING_FIELD_RE = re.compile(r"\{\{|\}\}|\{((?:[^{}]|\{[^{}]*\})*)\}")
+
+
+def _blank_python_noise(match: re.Match[str]) -> str:
+    """Blank a Python comment or string, keeping the code in f-string fields."""
+    prefix = match.group(1)
+    if not prefix or "f" not in prefix.lower():
+        return " "
+    fields = _FSTRING_FIELD_RE.findall(match.group(0))
+    return " " + " ".join(
+        _NOISE_RE["python"].sub(_blank_python_noise, field) for field in fields
+    ) + " "
+
+
+# What each noise match is replaced with
+_NOISE_REPL = {"python": _blank_python_noise}
 
 
 def build_call_graph(
     project_dir: str,
     language: str,
     overrides: dict[str, list[str]] | None = None,
+    jobs: int = 1,
 ) -> dict[str, list[str]]:
     """Build a full call graph for the project.
 
+    Files are processed independently; with ``jobs != 1`` they are spread
+    over a process pool (``jobs=0`` uses one worker per CPU).
+
     Returns a dict mapping caller function name -> list of callee names.
     """
-    symbols = list_symbols(project_dir)
-    graph: dict[str, list[str]] = {}
+    # Interned so graph keys, the symbol set and every callee list share
+    # one string object per name.
+    symbols = [sys.intern(s) for s in list_symbols(project_dir)]
     symbol_set = set(symbols)
 
+    definitions = find_all_definitions(project_dir)
+    defs_by_file: dict[str, list[FunctionDef]] = {}
+    for sym in symbols:
+        func_def = definitions.get(sym)
+        if func_def is not None:
+            defs_by_file.setdefault(func_def.file, []).append(func_def)
+
+    calls_by_sym: dict[str, list[str]] = {}
+    if jobs == 1 or len(defs_by_file) <= 1:
+        for defs in defs_by_file.values():
+            calls_by_sym.update(
+                _calls_in_file(project_dir, defs, language, symbol_set)
+            )
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs or None,
+            initializer=_init_worker,
+            initargs=(project_dir, language, symbol_set),
+        ) as pool:
+            for calls in pool.map(_worker_calls_in_file, defs_by_file.values()):
+                calls_by_sym.update(calls)
+
+    # Callee sets are only sorted once, after FP edges and overrides are in.
+    graph_sets: dict[str, set[str]] = {}
     for sym in symbols:
-        callees = _callees_of(sym, project_dir, language, symbol_set)
+        callees = calls_by_sym.get(sym)
         if callees:
-            graph[sym] = callees
+            graph_sets[sym] = set(callees)
 
     # C function pointer handling
     if language == "c":
         fp_edges = _resolve_c_function_pointers(project_dir, symbol_set)
         for caller, targets in fp_edges.items():
-            existing = set(graph.get(caller, []))
-            existing.update(targets)
-            graph[caller] = sorted(existing)
+            graph_sets.setdefault(caller, set()).update(targets)
 
     # Merge manual overrides
     if overrides:
         for caller, targets in overrides.items():
-            existing = set(graph.get(caller, []))
-            existing.update(targets)
-            graph[caller] = sorted(existing)
+            graph_sets.setdefault(caller, set()).update(targets)
 
-    return graph
+    return {caller: sorted(callees) for caller, callees in graph_sets.items()}
 
 
-def _callees_of(
-    func_name: str,
+def _calls_in_file(
     project_dir: str,
+    defs: list[FunctionDef],
     language: str,
     known_symbols: set[str],
-) -> list[str]:
-    """Extract function calls from the body of func_name."""
-    defs = find_definition(func_name, project_dir)
-    if not defs:
-        return []
+) -> dict[str, list[str]]:
+    """Extract callees for every function defined in one file."""
+    calls: dict[str, list[str]] = {}
+    for name, body in get_function_bodies(defs, project_dir).items():
+        if body.source.strip():
+            calls[name] = _extract_calls_from_source(
+                body.source, language, known_symbols
+            )
+    return calls
 
-    # Use first definition
-    func_def = defs[0]
-    body = get_function_body(func_def, project_dir, language)
-    if body is None or not body.source.strip():
-        return []
 
-    return _extract_calls_from_source(body.source, language, known_symbols)
+# Per-process state for pool workers, set once by _init_worker so the
+# symbol set is not re-pickled with every task.
+_worker_args: tuple[str, str, set[str]] | None = None
+
+
+def _init_worker(project_dir: str, language: str, known_symbols: set[str]) -> None:
+    global _worker_args
+    _worker_args = (project_dir, language, known_symbols)
+
+
+def _worker_calls_in_file(defs: list[FunctionDef]) -> dict[str, list[str]]:
+    assert _worker_args is not None
+    project_dir, language, known_symbols = _worker_args
+    return _calls_in_file(project_dir, defs, language, known_symbols)
+
+
+def reverse_call_graph(graph: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Invert a call graph into a callee -> sorted callers mapping."""
+    reverse: dict[str, list[str]] = {}
+    for caller in sorted(graph):
+        for callee in graph[caller]:
+            reverse.setdefault(callee, []).append(caller)
+    return reverse
 
 
 def _extract_calls_from_source(
@@ -88,27 +193,17 @@ def _extract_calls_from_source(
     language: str,
     known_symbols: set[str],
 ) -> list[str]:
-    """Tokenize source with Pygments and extract function call names."""
-    lexer_cls = LEXER_MAP.get(language)
-    if lexer_cls is None:
+    """Scan source for calls to known symbols, ignoring comments and strings."""
+    noise_re = _NOISE_RE.get(language)
+    if noise_re is None:
         return []
 
-    lexer = lexer_cls(stripnl=False, ensurenl=False)
-    tokens = list(lexer.get_tokens(source))
-
-    calls: set[str] = set()
-
-    for i, (ttype, value) in enumerate(tokens):
-        if ttype in Token.Name and value in known_symbols:
-            # Look ahead for a '(' to confirm it's a call
-            for j in range(i + 1, min(i + 5, len(tokens))):
-                next_type, next_val = tokens[j]
-                if next_type in Token.Text or next_type in Token.Comment:
-                    continue
-                if next_val == "(":
-                    calls.add(value)
-                break
-
+    cleaned = noise_re.sub(_NOISE_REPL.get(language, " "), source)
+    calls = {
+        sys.intern(name)
+        for name in _CALL_RE[language].findall(cleaned)
+        if name in known_symbols
+    }
     return sorted(calls)
 
 
@@ -119,68 +214,78 @@ def _resolve_c_function_pointers(
     """Scan for C struct field assignments that look like function pointers.
 
     Pattern: .field = func_name  or  ->field = func_name
-    Uses ripgrep for speed, falls back to nothing if rg unavailable.
+    Uses ripgrep for speed, falls back to nothing if rg unavailable.  rg
+    output is parsed as it streams in, and hits are grouped by file so each
+    file's definitions are listed only once.
     """
-    rg = shutil.which("rg")
+    rg = which("rg")
     if rg is None:
         return {}
 
-    root = Path(project_dir).resolve()
+    root = resolve_project(project_dir)
     # Match patterns like: .ops = my_func  or  ->handler = callback
-    result = subprocess.run(
+    hits_by_file: dict[str, list[tuple[int, str]]] = {}
+    with subprocess.Popen(
         [
             rg,
-            "--no-heading",
-            "-n",
-            r"(?:->|\.)(\w+)\s*=\s*(\w+)",
+            "--json",
+            _FP_ASSIGN_RE.pattern,
             "--type", "c",
         ],
         cwd=str(root),
-        capture_output=True,
-        text=True,
-    )
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as proc:
+        # Raw bytes straight into the JSON loader; no text decoding layer
+        for raw_line in proc.stdout:
+            try:
+                msg = loads(raw_line)
+            except ValueError:
+                continue
+            if msg.get("type") != "match":
+                continue
+            data = msg["data"]
+            path = data.get("path", {}).get("text")
+            line_no = data.get("line_number")
+            text = data.get("lines", {}).get("text", "")
+            if path is None or line_no is None:
+                continue
+            for m in _FP_ASSIGN_RE.finditer(text):
+                target = m.group(2)
+                if target in known_symbols:
+                    hits_by_file.setdefault(path, []).append((line_no, target))
 
     edges: dict[str, list[str]] = {}
-    pattern = re.compile(r"(?:->|\.)(\w+)\s*=\s*(\w+)")
-
-    for line in result.stdout.splitlines():
-        m = pattern.search(line)
-        if m:
-            _field_name = m.group(1)
-            target = m.group(2)
-            if target in known_symbols:
-                file_match = re.match(r"^(.+?):(\d+):", line)
-                if file_match:
-                    caller = _find_enclosing_function(
-                        root / file_match.group(1),
-                        int(file_match.group(2)),
-                        project_dir,
-                    )
-                    if caller:
-                        edges.setdefault(caller, []).append(target)
+    for path, hits in hits_by_file.items():
+        defs = _file_definitions(root / path, project_dir)
+        if not defs:
+            continue
+        for line_no, target in hits:
+            caller = _enclosing_function(defs, line_no)
+            if caller:
+                edges.setdefault(caller, []).append(target)
 
     return edges
 
 
-def _find_enclosing_function(
+def _file_definitions(
     filepath: Path,
-    line_no: int,
     project_dir: str,
-) -> str | None:
-    """Best-effort: find which function encloses a given line.
+) -> list[tuple[int, str]]:
+    """List (line, name) definitions in a file, sorted by line.
 
-    Uses `global -f` to list definitions in file, picks the nearest
-    definition above line_no.
+    Uses `global -f`; returns an empty list if Global is unavailable or the
+    file lies outside the project.
     """
-    global_bin = shutil.which("global")
+    global_bin = which("global")
     if global_bin is None:
-        return None
+        return []
 
-    root = Path(project_dir).resolve()
+    root = resolve_project(project_dir)
     try:
         relpath = filepath.relative_to(root)
     except ValueError:
-        return None
+        return []
 
     result = subprocess.run(
         [global_bin, "-f", str(relpath)],
@@ -189,19 +294,25 @@ def _find_enclosing_function(
         text=True,
     )
 
-    best_name: str | None = None
-    best_line = 0
-
+    # First name reported at a given line wins
+    by_line: dict[int, str] = {}
     for out_line in result.stdout.strip().splitlines():
         parts = out_line.split()
         if len(parts) >= 3:
-            name = parts[0]
             try:
                 defline = int(parts[1])
             except ValueError:
                 continue
-            if defline <= line_no and defline > best_line:
-                best_line = defline
-                best_name = name
+            if defline > 0:
+                by_line.setdefault(defline, parts[0])
 
-    return best_name
+    return sorted(by_line.items())
+
+
+def _enclosing_function(
+    defs: list[tuple[int, str]],
+    line_no: int,
+) -> str | None:
+    """Best-effort: the nearest definition at or above *line_no*."""
+    i = bisect.bisect_right(defs, (line_no, "\uffff"))
+    return defs[i - 1][1] if i else None
@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 import argparse
-from typing import Any
+from typing import Any, Iterator
 
 
-def register(subparsers: argparse._SubParsersAction) -> None:
+def _non_negative_int(value: str) -> int:
+    """Parse a ``--jobs`` count, rejecting negative numbers."""
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {value!r}") from None
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {jobs}")
+    return jobs
+
+
+def register(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
     """Register the ``graph`` subcommand and its sub-actions."""
     grp = subparsers.add_parser("graph", help="Call graph operations")
     grp_sub = grp.add_subparsers(dest="action")
@@ -28,6 +39,12 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     bld.add_argument(
         "--force", action="store_true", help="Rebuild even if cached"
     )
+    bld.add_argument(
+        "--jobs",
+        type=_non_negative_int,
+        default=1,
+        help="Worker processes for scanning files (0 = one per CPU, default: 1)",
+    )
 
     # --- graph show ---
     shw = grp_sub.add_parser("show", help="Dump full call graph")
@@ -37,6 +54,14 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Fail if graph doesn't exist instead of auto-building",
     )
+    shw.add_argument(
+        "--jsonl",
+        action="store_true",
+        help=(
+            "Emit one JSON object per line (header, then one per caller); "
+            "the graph is still loaded in full"
+        ),
+    )
 
     # --- graph callees ---
     ce = grp_sub.add_parser("callees", help="List direct callees of a function")
@@ -58,8 +83,20 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         help="Fail if graph doesn't exist instead of auto-building",
     )
 
+    return grp
+
+
+def _show_records(result: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield a ``graph show`` result as a header record plus one per caller."""
+    yield {
+        "node_count": result["node_count"],
+        "edge_count": result["edge_count"],
+    }
+    for caller, names in result["graph"].items():
+        yield {"caller": caller, "callees": names}
+
 
-def run(args: argparse.Namespace) -> dict[str, Any]:
+def run(args: argparse.Namespace) -> dict[str, Any] | Iterator[dict[str, Any]]:
     """Dispatch to the appropriate graph action."""
     from claudit.skills.graph import build, show, callees, callers
 
@@ -69,10 +106,14 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             language=args.language,
             overrides_path=args.overrides,
             force=args.force,
+            jobs=args.jobs,
         )
 
     if args.action == "show":
-        return show(args.project_dir, auto_build=not args.no_auto_build)
+        result = show(args.project_dir, auto_build=not args.no_auto_build)
+        if args.jsonl:
+            return _show_records(result)
+        return result
 
     if args.action == "callees":
         return callees(
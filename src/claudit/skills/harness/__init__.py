@@ -13,13 +13,19 @@ Extraction:
 - list_functions_in_file(project_dir, filepath) -> list[dict]
 
 Analysis (diagnostic aids):
-- analyze_dependencies(project_dir, function_names, depth=1) -> DependencySet
+- analyze_dependencies(project_dir, function_names, depth=1, max_stubs=None) -> DependencySet
 - get_function_signature(project_dir, function_name, language=None) -> FunctionSignature | None
 - get_function_callees(project_dir, function_name) -> list[str]
 """
 
 from __future__ import annotations
 
+from pathlib import Path
+
+from claudit.lang import detect_language
+from claudit.skills.graph import show as show_graph
+from claudit.skills.graph.cache import load_call_graph
+from claudit.skills.index import lookup
 from claudit.skills.harness.extractor import (
     ExtractedFunction,
     extract_target_functions,
@@ -67,8 +73,6 @@ def extract_function(
     Returns:
         ExtractedFunction if found, None otherwise
     """
-    from claudit.lang import detect_language
-
     if language is None:
         language = detect_language(project_dir)
 
@@ -94,8 +98,6 @@ def extract_functions(
     Raises:
         ValueError: If a function cannot be found
     """
-    from claudit.lang import detect_language
-
     if language is None:
         language = detect_language(project_dir)
 
@@ -120,8 +122,6 @@ def extract_file(
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    from claudit.lang import detect_language
-
     if language is None:
         language = detect_language(project_dir)
 
@@ -132,6 +132,7 @@ def analyze_dependencies(
     project_dir: str,
     function_names: list[str],
     depth: int = 1,
+    max_stubs: int | None = None,
 ) -> DependencySet:
     """Analyze dependencies without full orchestration.
 
@@ -139,26 +140,24 @@ def analyze_dependencies(
         project_dir: Project directory path
         function_names: List of function names to analyze
         depth: How many levels deep to analyze (default: 1)
+        max_stubs: Stop once this many stub candidates are found (default: no cap)
 
     Returns:
         DependencySet with stub_functions, dependency_map, excluded_stdlib
     """
-    from claudit.lang import detect_language
-    from claudit.skills.index.indexer import ensure_index
-    from claudit.skills.graph import build as build_graph
-    from claudit.skills.graph.cache import load_call_graph
+    if not function_names:
+        # Nothing to analyze; don't index or build a graph for it
+        return DependencySet()
 
-    language = detect_language(project_dir)
-    ensure_index(project_dir)
-
-    # Ensure call graph exists
-    graph = load_call_graph(project_dir)
-    if graph is None:
-        build_graph(project_dir, language=language)
-        graph = load_call_graph(project_dir) or {}
+    # The graph skill owns load-or-build (index + language detection included)
+    graph = show_graph(project_dir)["graph"]
 
     return _analyze_dependencies(
-        project_dir, set(function_names), graph, stub_depth=depth
+        project_dir,
+        frozenset(function_names),
+        graph,
+        stub_depth=depth,
+        max_stubs=max_stubs,
     )
 
 
@@ -177,10 +176,6 @@ def get_function_signature(
     Returns:
         FunctionSignature if found, None otherwise
     """
-    from pathlib import Path
-    from claudit.lang import detect_language
-    from claudit.skills.index import lookup
-
     if language is None:
         language = detect_language(project_dir)
 
@@ -208,8 +203,6 @@ def get_function_callees(
     Returns:
         List of function names called by the target function
     """
-    from claudit.skills.graph.cache import load_call_graph
-
     graph = load_call_graph(project_dir)
     if graph is None:
         return []
@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import argparse
+from pathlib import Path
 from typing import Any
 
+from claudit.skills.harness import (
+    extract_functions,
+    extract_file,
+    list_functions_in_file,
+    analyze_dependencies,
+    get_function_signature,
+)
 
-def register(subparsers: argparse._SubParsersAction) -> None:
+
+def register(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
     """Register the ``harness`` subcommand and its sub-actions."""
     harness = subparsers.add_parser(
         "harness", help="Extract code and analyze dependencies for test harnesses"
@@ -33,6 +42,15 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         default=None,
         help="Language hint (auto-detected if omitted)",
     )
+    extract.add_argument(
+        "--output",
+        help="Write the extracted sources to this file instead of the JSON result",
+    )
+    extract.add_argument(
+        "--summary",
+        action="store_true",
+        help="Omit function sources from the result",
+    )
 
     # --- harness list-functions ---
     list_funcs = harness_sub.add_parser(
@@ -46,17 +64,33 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         "analyze-deps", help="Analyze function dependencies"
     )
     analyze.add_argument("project_dir", help="Path to the project")
-    analyze.add_argument(
+    names = analyze.add_mutually_exclusive_group(required=True)
+    names.add_argument(
         "--functions",
-        required=True,
         help="Comma-separated list of function names to analyze",
     )
+    names.add_argument(
+        "--functions-file",
+        help="File with one function name per line (for large batches)",
+    )
     analyze.add_argument(
         "--depth",
         type=int,
         default=1,
         help="Dependency depth (default: 1)",
     )
+    analyze.add_argument(
+        "--max-stubs",
+        type=int,
+        default=None,
+        help="Stop after finding this many stub candidates (default: no cap)",
+    )
+    analyze.add_argument(
+        "--sort",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Sort output name lists (default); --no-sort skips it for large results",
+    )
 
     # --- harness get-signature ---
     get_sig = harness_sub.add_parser(
@@ -71,17 +105,11 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         help="Language hint (auto-detected if omitted)",
     )
 
+    return harness
+
 
 def run(args: argparse.Namespace) -> dict[str, Any]:
     """Dispatch to the appropriate harness action."""
-    from claudit.skills.harness import (
-        extract_functions,
-        extract_file,
-        list_functions_in_file,
-        analyze_dependencies,
-        get_function_signature,
-    )
-
     if args.action == "extract":
         if args.functions:
             function_list = [f.strip() for f in args.functions.split(",")]
@@ -97,38 +125,58 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
                 language=args.language,
             )
 
-        # Format for output
-        return {
-            "extracted": [
-                {
-                    "function": func.name,
-                    "file": func.file,
-                    "start_line": func.start_line,
-                    "end_line": func.end_line,
-                    "source": func.source,
-                    "signature": func.signature,
-                    "language": func.language,
-                }
-                for func in result
-            ]
-        }
+        if args.output:
+            # Written function by function so the sources are never joined
+            # into one large string
+            with open(args.output, "w", encoding="utf-8") as out:
+                for func in result:
+                    out.write(func.source)
+                    out.write("\n\n")
+
+        # Format for output; the source only goes inline when it was
+        # neither written to a file nor summarised away
+        inline_source = not (args.output or args.summary)
+        extracted = []
+        for func in result:
+            entry = {
+                "function": func.name,
+                "file": func.file,
+                "start_line": func.start_line,
+                "end_line": func.end_line,
+            }
+            if inline_source:
+                entry["source"] = func.source
+            entry["signature"] = func.signature
+            entry["language"] = func.language
+            extracted.append(entry)
+        if args.output:
+            return {"extracted": extracted, "output": args.output}
+        return {"extracted": extracted}
 
     elif args.action == "list-functions":
         funcs = list_functions_in_file(args.project_dir, args.file)
         return {"functions": funcs, "count": len(funcs)}
 
     elif args.action == "analyze-deps":
-        function_list = [f.strip() for f in args.functions.split(",")]
+        if args.functions:
+            function_list = [f.strip() for f in args.functions.split(",")]
+        else:
+            text = Path(args.functions_file).read_text()
+            function_list = list(dict.fromkeys(
+                line.strip() for line in text.splitlines() if line.strip()
+            ))
         deps = analyze_dependencies(
             args.project_dir,
             function_list,
             depth=args.depth,
+            max_stubs=args.max_stubs,
         )
+        order = sorted if args.sort else list
         return {
-            "stub_functions": sorted(deps.stub_functions),
+            "stub_functions": order(deps.stub_functions),
             "dependency_map": deps.dependency_map,
-            "excluded_stdlib": sorted(deps.excluded_stdlib),
-            "excluded_extracted": sorted(deps.excluded_extracted),
+            "excluded_stdlib": order(deps.excluded_stdlib),
+            "excluded_extracted": order(deps.excluded_extracted),
         }
 
     elif args.action == "get-signature":
@@ -7,11 +7,13 @@ library functions.
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
+from typing import AbstractSet
 
+from claudit.skills.index.indexer import find_all_definitions, gtags_mtime
 
-@dataclass
+
+@dataclass(slots=True)
 class DependencySet:
     """Set of dependencies requiring stubs."""
 
@@ -23,9 +25,10 @@ class DependencySet:
 
 def analyze_dependencies(
     project_dir: str,
-    extracted_function_names: set[str],
+    extracted_function_names: AbstractSet[str],
     call_graph: dict[str, list[str]],
     stub_depth: int = 1,
+    max_stubs: int | None = None,
 ) -> DependencySet:
     """Identify all dependencies that need stubbing.
 
@@ -34,6 +37,7 @@ def analyze_dependencies(
         extracted_function_names: Set of function names already extracted
         call_graph: Call graph mapping function -> callees
         stub_depth: How many levels deep to analyze dependencies
+        max_stubs: Stop the walk once this many stubs are found (None: no cap)
 
     Returns:
         DependencySet with functions to stub and exclusions
@@ -43,208 +47,203 @@ def analyze_dependencies(
     # Track all functions we've seen in the call graph (project functions)
     project_functions = set(call_graph.keys())
 
-    # BFS to find dependencies up to stub_depth
-    queue: deque[tuple[str, int]] = deque()
-
-    # Start with extracted functions at depth 0
-    for func in extracted_function_names:
-        queue.append((func, 0))
-
+    # Level-synchronous BFS up to stub_depth: each pass walks one depth's
+    # frontier, starting with the extracted functions at depth 0
+    frontier = list(extracted_function_names)
     visited = set(extracted_function_names)
 
-    while queue:
-        func, depth = queue.popleft()
+    for _ in range(stub_depth):
+        next_frontier: list[str] = []
 
-        # Stop if we've reached max depth
-        if depth >= stub_depth:
-            continue
-
-        # Get direct callees
-        callees = call_graph.get(func, [])
+        for func in frontier:
+            # Get direct callees, dropping repeated edges so each is checked once
+            callees = call_graph.get(func)
+            if not callees:
+                continue
+            callees = list(dict.fromkeys(callees))
 
-        # Record dependency relationship
-        if callees:
+            # Record dependency relationship
             result.dependency_map[func] = callees
 
-        for callee in callees:
-            if callee in visited:
-                continue
-
-            visited.add(callee)
-
-            # Categorize the callee
-            if callee in extracted_function_names:
-                # Already extracted - no need to stub
-                result.excluded_extracted.add(callee)
-            elif callee not in project_functions:
-                # Not in call graph - likely stdlib
-                result.excluded_stdlib.add(callee)
-            elif _is_stdlib_function(callee):
-                # Known stdlib function
-                result.excluded_stdlib.add(callee)
-            else:
-                # Project function that needs stubbing
-                result.stub_functions.add(callee)
-
-                # Continue BFS from this function
-                queue.append((callee, depth + 1))
+            for callee in callees:
+                if callee in visited:
+                    continue
+
+                visited.add(callee)
+
+                # Categorize the callee
+                if callee in extracted_function_names:
+                    # Already extracted - no need to stub
+                    result.excluded_extracted.add(callee)
+                elif callee not in project_functions:
+                    # Not in call graph - likely stdlib
+                    result.excluded_stdlib.add(callee)
+                elif _is_stdlib_function(callee):
+                    # Known stdlib function
+                    result.excluded_stdlib.add(callee)
+                else:
+                    # Project function that needs stubbing; a full stub
+                    # list ends the walk early
+                    stubs = result.stub_functions
+                    if max_stubs is not None and len(stubs) >= max_stubs:
+                        return result
+                    stubs.add(callee)
+
+                    # Continue BFS from this function at the next depth
+                    next_frontier.append(callee)
+
+        if not next_frontier:
+            break
+        frontier = next_frontier
 
     return result
 
 
+# C standard library functions (common ones)
+_C_STDLIB: frozenset[str] = frozenset({
+    # stdio.h
+    "printf",
+    "fprintf",
+    "sprintf",
+    "snprintf",
+    "scanf",
+    "fscanf",
+    "sscanf",
+    "fopen",
+    "fclose",
+    "fread",
+    "fwrite",
+    "fgets",
+    "fputs",
+    "getc",
+    "putc",
+    "feof",
+    "ferror",
+    "fflush",
+    "fseek",
+    "ftell",
+    "rewind",
+    "perror",
+    # stdlib.h
+    "malloc",
+    "calloc",
+    "realloc",
+    "free",
+    "exit",
+    "abort",
+    "atexit",
+    "atoi",
+    "atof",
+    "atol",
+    "strtol",
+    "strtod",
+    "rand",
+    "srand",
+    "qsort",
+    "bsearch",
+    # string.h
+    "strlen",
+    "strcpy",
+    "strncpy",
+    "strcat",
+    "strncat",
+    "strcmp",
+    "strncmp",
+    "strchr",
+    "strrchr",
+    "strstr",
+    "strtok",
+    "memcpy",
+    "memmove",
+    "memset",
+    "memcmp",
+    # math.h
+    "sin",
+    "cos",
+    "tan",
+    "sqrt",
+    "pow",
+    "exp",
+    "log",
+    "floor",
+    "ceil",
+    # time.h
+    "time",
+    "clock",
+    "difftime",
+    "mktime",
+    # unistd.h / POSIX
+    "read",
+    "write",
+    "open",
+    "close",
+    "lseek",
+    "getpid",
+    "fork",
+    "exec",
+    "execve",
+    # ctype.h
+    "isalpha",
+    "isdigit",
+    "isalnum",
+    "isspace",
+    "toupper",
+    "tolower",
+})
+
+# Java standard library patterns (common packages); a tuple so a single
+# str.startswith() call checks them all
+_JAVA_STDLIB_PREFIXES: tuple[str, ...] = (
+    "System.",
+    "String.",
+    "Integer.",
+    "Long.",
+    "Double.",
+    "Math.",
+    "Thread.",
+    "Object.",
+    "Class.",
+    "Exception.",
+)
+
+# Python built-ins (common ones)
+_PYTHON_BUILTINS: frozenset[str] = frozenset({
+    "print",
+    "len",
+    "range",
+    "enumerate",
+    "zip",
+    "map",
+    "filter",
+    "sum",
+    "min",
+    "max",
+    "sorted",
+    "list",
+    "dict",
+    "set",
+    "tuple",
+    "str",
+    "int",
+    "float",
+    "bool",
+    "open",
+    "isinstance",
+    "hasattr",
+    "getattr",
+    "setattr",
+})
+
+# Exact names from every language, so one hash lookup covers them all
+_STDLIB_NAMES: frozenset[str] = _C_STDLIB | _PYTHON_BUILTINS
+
+
 def _is_stdlib_function(func_name: str) -> bool:
     """Heuristic: check if function is likely a standard library function.
 
     This is a best-effort heuristic and may have false positives/negatives.
     """
-    # C standard library functions (common ones)
-    c_stdlib = {
-        # stdio.h
-        "printf",
-        "fprintf",
-        "sprintf",
-        "snprintf",
-        "scanf",
-        "fscanf",
-        "sscanf",
-        "fopen",
-        "fclose",
-        "fread",
-        "fwrite",
-        "fgets",
-        "fputs",
-        "getc",
-        "putc",
-        "feof",
-        "ferror",
-        "fflush",
-        "fseek",
-        "ftell",
-        "rewind",
-        "perror",
-        # stdlib.h
-        "malloc",
-        "calloc",
-        "realloc",
-        "free",
-        "exit",
-        "abort",
-        "atexit",
-        "atoi",
-        "atof",
-        "atol",
-        "strtol",
-        "strtod",
-        "rand",
-        "srand",
-        "qsort",
-        "bsearch",
-        # string.h
-        "strlen",
-        "strcpy",
-        "strncpy",
-        "strcat",
-        "strncat",
-        "strcmp",
-        "strncmp",
-        "strchr",
-        "strrchr",
-        "strstr",
-        "strtok",
-        "memcpy",
-        "memmove",
-        "memset",
-        "memcmp",
-        # math.h
-        "sin",
-        "cos",
-        "tan",
-        "sqrt",
-        "pow",
-        "exp",
-        "log",
-        "floor",
-        "ceil",
-        # time.h
-        "time",
-        "clock",
-        "difftime",
-        "mktime",
-        # unistd.h / POSIX
-        "read",
-        "write",
-        "open",
-        "close",
-        "lseek",
-        "getpid",
-        "fork",
-        "exec",
-        "execve",
-        # ctype.h
-        "isalpha",
-        "isdigit",
-        "isalnum",
-        "isspace",
-        "toupper",
-        "tolower",
-    }
-
-    # Java standard library patterns (common packages)
-    java_stdlib_prefixes = [
-        "System.",
-        "String.",
-        "Integer.",
-        "Long.",
-        "Double.",
-        "Math.",
-        "Thread.",
-        "Object.",
-        "Class.",
-        "Exception.",
-    ]
-
-    # Python built-ins (common ones)
-    python_builtins = {
-        "print",
-        "len",
-        "range",
-        "enumerate",
-        "zip",
-        "map",
-        "filter",
-        "sum",
-        "min",
-        "max",
-        "sorted",
-        "list",
-        "dict",
-        "set",
-        "tuple",
-        "str",
-        "int",
-        "float",
-        "bool",
-        "open",
-        "isinstance",
-        "hasattr",
-        "getattr",
-        "setattr",
-    }
-
-    # Check C stdlib
-    if func_name in c_stdlib:
-        return True
-
-    # Check Java stdlib patterns
-    for prefix in java_stdlib_prefixes:
-        if func_name.startswith(prefix):
-            return True
-
-    # Check Python builtins
-    if func_name in python_builtins:
-        return True
-
-    return False
+    return func_name in _STDLIB_NAMES or func_name.startswith(_JAVA_STDLIB_PREFIXES)
 
 
 def filter_stub_functions(
@@ -263,20 +262,14 @@ def filter_stub_functions(
     Returns:
         Filtered set of functions that exist in the project
     """
-    from claudit.skills.index import lookup
-
-    filtered = set()
-
-    for func in stub_functions:
-        try:
-            # Try to look up the function
-            result = lookup(project_dir, func, kind="definitions", auto_index=False)
+    # No index means nothing can be confirmed (the index is never built here)
+    if not gtags_mtime(project_dir):
+        return set()
 
-            # If we found a definition, keep it
-            if result.get("definitions"):
-                filtered.add(func)
-        except Exception:
-            # If lookup fails, exclude it (likely stdlib or external)
-            pass
+    try:
+        # One Global query for every definition instead of one per function
+        defined = find_all_definitions(project_dir)
+    except Exception:
+        return set()
 
-    return filtered
+    return {func for func in stub_functions if func in defined}
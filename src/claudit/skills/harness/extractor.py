@@ -6,15 +6,27 @@ appear in the source code, preserving formatting, comments, and whitespace.
 
 from __future__ import annotations
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 from claudit.skills.index import get_body
-from claudit.skills.index.indexer import get_ctags_tags
+from claudit.skills.index.indexer import (
+    FunctionDef,
+    get_ctags_tags,
+    get_function_body,
+    iter_function_tags,
+    resolve_project,
+)
 from claudit.skills.harness.signature_extractor import extract_signature
 
+# Upper bound on threads used by extract_target_functions
+_MAX_WORKERS = 8
 
-@dataclass
+
+@dataclass(slots=True)
 class ExtractedFunction:
     """A function extracted verbatim from source."""
 
@@ -45,40 +57,53 @@ def extract_target_functions(
     Raises:
         ValueError: If a function cannot be found
     """
-    extracted = []
-
-    for func_name in function_names:
-        # Use index.get_body to extract function source
-        body_result = get_body(
-            project_dir,
-            func_name,
-            language=language,
-            auto_index=True,
-        )
-
-        if body_result is None:
-            raise ValueError(f"Function '{func_name}' not found in project")
-
-        # Extract signature
-        filepath = Path(project_dir) / body_result["file"]
-        sig = extract_signature(str(filepath), func_name, language)
-
-        signature_str = sig.full_signature if sig else f"{func_name}(...)"
+    if not function_names:
+        return []
 
-        # Create ExtractedFunction object
-        extracted.append(
-            ExtractedFunction(
-                name=func_name,
-                file=body_result["file"],
-                start_line=body_result["start_line"],
-                end_line=body_result["end_line"],
-                source=body_result["source"],
-                signature=signature_str,
-                language=language,
-            )
-        )
-
-    return extracted
+    root = resolve_project(project_dir)
+    extract_one = functools.partial(_extract_one, project_dir, root, language=language)
+
+    # The first lookup runs alone so an index created on demand is built
+    # once; the remaining Global and ctags calls are subprocess-bound and
+    # overlap in threads.  Results (and errors) keep the input order.
+    first = extract_one(function_names[0])
+    rest = function_names[1:]
+    if not rest:
+        return [first]
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(rest))) as pool:
+        return [first, *pool.map(extract_one, rest)]
+
+
+def _extract_one(
+    project_dir: str, root: Path, func_name: str, *, language: str
+) -> ExtractedFunction:
+    """Extract one function for :func:`extract_target_functions`."""
+    # Use index.get_body to extract function source
+    body_result = get_body(
+        project_dir,
+        func_name,
+        language=language,
+        auto_index=True,
+    )
+
+    if body_result is None:
+        raise ValueError(f"Function '{func_name}' not found in project")
+
+    # Extract signature
+    filepath = root / body_result["file"]
+    sig = extract_signature(str(filepath), func_name, language)
+
+    signature_str = sig.full_signature if sig else f"{func_name}(...)"
+
+    return ExtractedFunction(
+        name=func_name,
+        file=body_result["file"],
+        start_line=body_result["start_line"],
+        end_line=body_result["end_line"],
+        source=body_result["source"],
+        signature=signature_str,
+        language=language,
+    )
 
 
 def extract_functions_from_file(
@@ -100,32 +125,49 @@ def extract_functions_from_file(
         FileNotFoundError: If file doesn't exist
     """
     # Resolve file path
-    root = Path(project_dir).resolve()
+    root = resolve_project(project_dir)
     full_path = root / filepath
 
     if not full_path.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
 
+    # Reported relative to the project root, as Global reports the files
+    # that extract_target_functions() finds
+    rel_path = Path(os.path.relpath(full_path, root)).as_posix()
+
     # Use ctags to list all functions in file
     tags = get_ctags_tags(str(full_path))
 
-    # Filter for function/method definitions
-    function_tags = [
-        tag
-        for tag in tags
-        if tag.get("kind") in ("function", "method", "def")
-        and tag.get("name")
+    # The tags already locate every definition, so no per-name Global
+    # lookup is needed; bodies come from the same (cached) ctags run and
+    # file read.
+    func_defs = [
+        FunctionDef(name=tag["name"], file=rel_path, line=tag.get("line", 0))
+        for tag in iter_function_tags(tags)
     ]
 
-    # Extract function names
-    function_names = [tag["name"] for tag in function_tags]
-
-    if not function_names:
+    if not func_defs:
         # No functions found in file
         return []
 
-    # Extract all functions
-    return extract_target_functions(project_dir, function_names, language)
+    extracted = []
+    for func_def in func_defs:
+        body = get_function_body(func_def, project_dir, language)
+        if body is None:
+            raise ValueError(f"Function '{func_def.name}' not found in project")
+        sig = extract_signature(str(full_path), func_def.name, language)
+        extracted.append(
+            ExtractedFunction(
+                name=func_def.name,
+                file=body.file,
+                start_line=body.start_line,
+                end_line=body.end_line,
+                source=body.source,
+                signature=sig.full_signature if sig else f"{func_def.name}(...)",
+                language=language,
+            )
+        )
+    return extracted
 
 
 def list_functions_in_file(
@@ -141,7 +183,7 @@ def list_functions_in_file(
     Returns:
         List of dicts with keys: name, line, kind
     """
-    root = Path(project_dir).resolve()
+    root = resolve_project(project_dir)
     full_path = root / filepath
 
     if not full_path.exists():
@@ -149,15 +191,11 @@ def list_functions_in_file(
 
     tags = get_ctags_tags(str(full_path))
 
-    functions = []
-    for tag in tags:
-        if tag.get("kind") in ("function", "method", "def"):
-            functions.append(
-                {
-                    "name": tag.get("name", ""),
-                    "line": tag.get("line", 0),
-                    "kind": tag.get("kind", ""),
-                }
-            )
-
-    return functions
+    return [
+        {
+            "name": tag["name"],
+            "line": tag.get("line", 0),
+            "kind": tag["kind"],
+        }
+        for tag in iter_function_tags(tags)
+    ]
@@ -6,13 +6,31 @@ parameter lists, and other metadata needed for stub generation.
 
 from __future__ import annotations
 
+import functools
+import os
+import re
+import sys
 from dataclasses import dataclass
-from pathlib import Path
+from typing import Callable
 
-from claudit.skills.index.indexer import get_ctags_tags
+from claudit.skills.index.indexer import (
+    get_ctags_tags,
+    iter_function_tags,
+    read_source_lines,
+)
 
+# Storage-class specifiers that precede a C return type
+_STORAGE_RE = re.compile(r"\b(?:static|extern|inline|__inline__)\b")
 
-@dataclass
+# The "(*name)" declarator of a function-pointer parameter
+_FUNC_PTR_RE = re.compile(r"\(\s*\*\s*(\w+)\s*\)")
+
+# Signatures of nullary functions, returned as [] without being parsed
+_NO_PARAMS: frozenset[str] = frozenset({"", "()", "( )"})
+_C_NO_PARAMS: frozenset[str] = _NO_PARAMS | {"(void)", "( void )"}
+
+
+@dataclass(frozen=True, slots=True)
 class Parameter:
     """Function parameter information."""
 
@@ -20,7 +38,7 @@ class Parameter:
     type: str = ""  # May be empty for Python
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionSignature:
     """Complete function signature information."""
 
@@ -46,32 +64,27 @@ def extract_signature(
     Returns:
         FunctionSignature if found, None otherwise
     """
-    tags = get_ctags_tags(filepath)
-
-    # Find the function tag
-    func_tag = None
-    for tag in tags:
-        if tag.get("name") == function_name and tag.get("kind") in (
-            "function",
-            "method",
-            "def",
-        ):
-            func_tag = tag
-            break
+    try:
+        mtime_ns = os.stat(filepath).st_mtime_ns
+    except OSError:
+        mtime_ns = -1
 
+    func_tag = _function_tags(str(filepath), mtime_ns).get(function_name)
     if func_tag is None:
         return None
 
-    # Parse language-specific signature
-    if language == "c":
-        return _parse_c_signature(func_tag, filepath)
-    elif language == "java":
-        return _parse_java_signature(func_tag, filepath)
-    elif language == "python":
-        return _parse_python_signature(func_tag, filepath)
-    else:
-        # Fallback: best effort
-        return _parse_generic_signature(func_tag, filepath)
+    # Parse language-specific signature; other languages get a best effort
+    parse = _SIGNATURE_PARSERS.get(language, _parse_generic_signature)
+    return parse(func_tag, filepath)
+
+
+@functools.lru_cache(maxsize=256)
+def _function_tags(filepath: str, mtime_ns: int) -> dict[str, dict]:
+    """Map function name -> its first function/method tag in *filepath*."""
+    index: dict[str, dict] = {}
+    for tag in iter_function_tags(get_ctags_tags(filepath)):
+        index.setdefault(tag["name"], tag)
+    return index
 
 
 def _parse_c_signature(tag: dict, filepath: str) -> FunctionSignature:
@@ -101,7 +114,7 @@ def _parse_c_signature(tag: dict, filepath: str) -> FunctionSignature:
 
     return FunctionSignature(
         name=name,
-        return_type=return_type,
+        return_type=sys.intern(return_type),
         parameters=parameters,
         full_signature=full_signature,
         is_method=False,
@@ -138,7 +151,7 @@ def _parse_java_signature(tag: dict, filepath: str) -> FunctionSignature:
 
     return FunctionSignature(
         name=name,
-        return_type=return_type,
+        return_type=sys.intern(return_type),
         parameters=parameters,
         full_signature=full_signature,
         is_method=is_method,
@@ -193,8 +206,41 @@ def _parse_generic_signature(tag: dict, filepath: str) -> FunctionSignature:
     )
 
 
+_SIGNATURE_PARSERS: dict[str, Callable[[dict, str], FunctionSignature]] = {
+    "c": _parse_c_signature,
+    "java": _parse_java_signature,
+    "python": _parse_python_signature,
+}
+
+
+def _split_top_level(sig: str) -> list[str]:
+    """Split a parameter list on commas outside (), <> and [].
+
+    Keeps ``int (*cb)(int, int)`` and ``Map<K, V> m`` in one piece.
+    """
+    if "," not in sig:
+        return [sig.strip()]
+
+    parts = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(sig):
+        if ch in "(<[":
+            depth += 1
+        elif ch in ")>]":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(sig[start:i].strip())
+            start = i + 1
+    parts.append(sig[start:].strip())
+    return parts
+
+
 def _parse_c_parameters(signature_str: str) -> list[Parameter]:
     """Parse C function parameters from signature string."""
+    if signature_str in _C_NO_PARAMS:
+        return []
+
     # Signature format: "(type1 name1, type2 name2, ...)"
     params = []
 
@@ -206,13 +252,19 @@ def _parse_c_parameters(signature_str: str) -> list[Parameter]:
     if not sig or sig.strip() in ("void", ""):
         return []
 
-    # Split by comma (simple parser, doesn't handle nested parens)
-    parts = [p.strip() for p in sig.split(",")]
+    parts = _split_top_level(sig)
 
     for part in parts:
         if not part:
             continue
 
+        # Function pointer: "int (*cb)(int, int)" -> cb, "int (*)(int, int)"
+        m = _FUNC_PTR_RE.search(part)
+        if m:
+            param_type = f"{part[:m.start()]}(*){part[m.end():]}"
+            params.append(Parameter(name=m.group(1), type=param_type))
+            continue
+
         # Split into type and name
         tokens = part.split()
         if len(tokens) >= 2:
@@ -232,6 +284,9 @@ def _parse_c_parameters(signature_str: str) -> list[Parameter]:
 
 def _parse_java_parameters(signature_str: str) -> list[Parameter]:
     """Parse Java method parameters from signature string."""
+    if signature_str in _NO_PARAMS:
+        return []
+
     # Similar to C but different syntax
     params = []
 
@@ -242,7 +297,7 @@ def _parse_java_parameters(signature_str: str) -> list[Parameter]:
     if not sig:
         return []
 
-    parts = [p.strip() for p in sig.split(",")]
+    parts = _split_top_level(sig)
 
     for part in parts:
         if not part:
@@ -261,6 +316,9 @@ def _parse_java_parameters(signature_str: str) -> list[Parameter]:
 
 def _parse_python_parameters(signature_str: str) -> list[Parameter]:
     """Parse Python function parameters from signature string."""
+    if signature_str in _NO_PARAMS:
+        return []
+
     # Python signature: (arg1, arg2=default, *args, **kwargs)
     params = []
 
@@ -293,8 +351,7 @@ def _parse_python_parameters(signature_str: str) -> list[Parameter]:
 def _extract_c_return_type(filepath: str, line_num: int, func_name: str) -> str:
     """Try to extract C return type by parsing the source line."""
     try:
-        path = Path(filepath)
-        lines = path.read_text(errors="replace").splitlines()
+        lines = read_source_lines(filepath)
 
         if line_num <= 0 or line_num > len(lines):
             return "void"
@@ -306,14 +363,10 @@ def _extract_c_return_type(filepath: str, line_num: int, func_name: str) -> str:
         # Example: "int foo()" -> "int"
         # Example: "static void * bar()" -> "void *"
 
-        if func_name in decl_line:
-            before_name = decl_line.split(func_name)[0].strip()
-
-            # Remove storage class specifiers
-            for keyword in ["static", "extern", "inline", "__inline__"]:
-                before_name = before_name.replace(keyword, "").strip()
-
-            # What remains should be the return type
+        before_name, found, _ = decl_line.partition(func_name)
+        if found:
+            # Remove storage class specifiers; what remains is the return type
+            before_name = _STORAGE_RE.sub("", before_name).strip()
             if before_name:
                 return before_name
 
@@ -6,7 +6,7 @@ import argparse
 from typing import Any
 
 
-def register(subparsers: argparse._SubParsersAction) -> None:
+def register(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
     """Register the ``highlight`` subcommand and its sub-actions."""
     hl = subparsers.add_parser("highlight", help="Syntax-highlighted source with annotations")
     hl_sub = hl.add_subparsers(dest="action")
@@ -43,6 +43,8 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         help="Pygments style name (default: monokai)",
     )
 
+    return hl
+
 
 def run(args: argparse.Namespace) -> dict[str, Any]:
     """Dispatch to the appropriate highlight action."""
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any
 
 from pygments import highlight as _pygments_highlight
 from pygments.formatters import HtmlFormatter
+from pygments.lexer import Lexer
 from pygments.lexers import get_lexer_by_name
 
-from claudit.lang import detect_language, LEXER_MAP
+from claudit.lang import detect_language, get_lexer_class
 from claudit.skills.index.indexer import (
     find_definition,
+    get_function_bodies,
     get_function_body,
+    read_source_lines,
+    resolve_project,
     FunctionBody,
     FunctionDef,
 )
@@ -40,12 +45,14 @@ def _hex_to_rgba(hex_color: str, alpha: float = 0.3) -> str:
     hex_color = hex_color.lstrip("#")
     if len(hex_color) != 6:
         return f"rgba(0, 0, 0, {alpha})"
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = bytes.fromhex(hex_color)
     return f"rgba({r}, {g}, {b}, {alpha})"
 
 
+# HOP_COLORS as the translucent rgba() strings used in results
+HOP_COLORS_RGBA = [_hex_to_rgba(color) for color in HOP_COLORS]
+
+
 def highlight_function(
     project_dir: str,
     function: str,
@@ -98,15 +105,21 @@ def highlight_path(
     if language is None:
         language = detect_language(project_dir)
 
+    defs_by_hop = [find_definition(func_name, project_dir) for func_name in path]
+    # Every hop but the last needs its body for the call site; fetching them
+    # together runs ctags once over all the files on the path
+    bodies = get_function_bodies(
+        [defs[0] for defs in defs_by_hop[:-1] if defs], project_dir
+    )
+
     results: list[dict[str, Any]] = []
     result_id = 0
 
     for hop_index, func_name in enumerate(path):
-        color_hex = HOP_COLORS[hop_index % len(HOP_COLORS)]
-        color_rgba = _hex_to_rgba(color_hex)
+        color_rgba = HOP_COLORS_RGBA[hop_index % len(HOP_COLORS_RGBA)]
         note = _build_hop_note(hop_index, func_name, path)
 
-        defs = find_definition(func_name, project_dir)
+        defs = defs_by_hop[hop_index]
         if not defs:
             result_id += 1
             results.append({
@@ -144,7 +157,7 @@ def highlight_path(
 
         if hop_index < len(path) - 1:
             next_func = path[hop_index + 1]
-            body = get_function_body(func_def, project_dir, language)
+            body = bodies.get(func_name)
             if body is not None:
                 call_site = _find_call_site(body, next_func)
                 if call_site is not None:
@@ -163,9 +176,10 @@ def highlight_path(
                         "color": color_rgba,
                     })
 
+    now = datetime.now(tz=timezone.utc)
     metadata = {
         "author": "claudit highlight",
-        "timestamp": datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+        "timestamp": now.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
         "tool": "claudit",
         "version": RESULTS_FORMAT_VERSION,
     }
@@ -178,17 +192,31 @@ def highlight_path(
 
 def _highlight_source(source: str, language: str, style: str) -> str:
     """Apply Pygments syntax highlighting to source code."""
-    lexer_cls = LEXER_MAP.get(language)
-    if lexer_cls is None:
-        try:
-            lexer = get_lexer_by_name(language)
-        except Exception:
-            return source
-    else:
-        lexer = lexer_cls()
+    if not source or source.isspace():
+        # Nothing to colour; don't run the lexer
+        return source
+    lexer = _get_lexer(language)
+    if lexer is None:
+        return source
+    return _pygments_highlight(source, lexer, _get_formatter(style))
+
+
+@functools.lru_cache(maxsize=16)
+def _get_lexer(language: str) -> Lexer | None:
+    """Return a shared lexer for *language*, or None if Pygments has none."""
+    lexer_cls = get_lexer_class(language)
+    if lexer_cls is not None:
+        return lexer_cls()
+    try:
+        return get_lexer_by_name(language)
+    except Exception:
+        return None
+
 
-    formatter = HtmlFormatter(style=style, nowrap=True)
-    return _pygments_highlight(source, lexer, formatter)
+@functools.lru_cache(maxsize=16)
+def _get_formatter(style: str) -> HtmlFormatter:
+    """Return a shared inline HTML formatter for *style*."""
+    return HtmlFormatter(style=style, nowrap=True)
 
 
 def _definition_span(
@@ -201,14 +229,8 @@ def _definition_span(
     """
     line = definition_line
     if line is None:
-        root = Path(project_dir).resolve()
-        filepath = root / func_def.file
-        if not filepath.exists():
-            return (func_def.line, 1, 1)
-        try:
-            lines = filepath.read_text(errors="replace").splitlines()
-        except OSError:
-            return (func_def.line, 1, 1)
+        # Shared with get_function_body, so a hop's file is read once
+        lines = read_source_lines(str(resolve_project(project_dir) / func_def.file))
         idx = func_def.line - 1
         if idx < 0 or idx >= len(lines):
             return (func_def.line, 1, 1)
@@ -239,27 +261,31 @@ def _find_call_site(
 ) -> dict[str, Any] | None:
     """Find where in the function body the callee is called.
 
-    Returns line, col_start, col_end (1-based; col_end inclusive), preferring
-    the occurrence of callee_name that is followed by '(' (actual call).
+    Returns line, col_start, col_end (1-based; col_end inclusive) of the
+    first occurrence of callee_name that is followed by '(' on the same line
+    (an actual call).
     """
-    lines = body.source.splitlines()
-    for i, line in enumerate(lines):
-        idx = 0
-        while True:
-            idx = line.find(callee_name, idx)
-            if idx == -1:
-                break
-            end = idx + len(callee_name)
-            rest = line[end:].lstrip()
-            if rest.startswith("("):
-                col_start = idx + 1
-                col_end = idx + len(callee_name)  # 1-based inclusive
-                return {
-                    "line": body.start_line + i,
-                    "col_start": col_start,
-                    "col_end": col_end,
-                    "callee": callee_name,
-                    "snippet": line.strip(),
-                }
-            idx = end
-    return None
+    source = body.source
+    m = _call_pattern(callee_name).search(source)
+    if m is None:
+        return None
+
+    idx = m.start()
+    line_start = source.rfind("\n", 0, idx) + 1
+    line_end = source.find("\n", idx)
+    if line_end == -1:
+        line_end = len(source)
+    col_start = idx - line_start + 1
+    return {
+        "line": body.start_line + source.count("\n", 0, idx),
+        "col_start": col_start,
+        "col_end": col_start + len(callee_name) - 1,  # 1-based inclusive
+        "callee": callee_name,
+        "snippet": source[line_start:line_end].strip(),
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _call_pattern(callee_name: str) -> re.Pattern[str]:
+    """Compile the search for a call to *callee_name* (whole identifier)."""
+    return re.compile(rf"(?<!\w){re.escape(callee_name)}[^\S\n]*\(")
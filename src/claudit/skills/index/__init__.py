@@ -10,6 +10,7 @@ Public API
 
 from __future__ import annotations
 
+import os
 from typing import Any
 
 from claudit.errors import IndexNotFoundError
@@ -23,19 +24,18 @@ from claudit.skills.index.indexer import (
     get_function_body as _get_function_body,
     list_symbols as _list_symbols,
     gtags_mtime,
+    resolve_project,
     _find_project_root,
 )
 
 
 def _require_index(project_dir: str, auto_index: bool) -> None:
     """Ensure GTAGS exists, or raise if auto_index is disabled."""
-    from pathlib import Path
-
     if auto_index:
         _ensure_index(project_dir)
     else:
-        root = Path(project_dir).resolve()
-        if not (root / "GTAGS").exists():
+        root = resolve_project(project_dir)
+        if not os.path.exists(os.path.join(root, "GTAGS")):
             raise IndexNotFoundError(
                 f"No index found at {root}. Run: claudit index create {project_dir}"
             )
@@ -46,10 +46,6 @@ def create(project_dir: str, *, force: bool = False) -> dict[str, Any]:
 
     Returns status dict with keys: status, project_dir, gtags_mtime.
     """
-    from pathlib import Path
-    import os
-    import subprocess
-
     root = _find_project_root(project_dir)
     gtags_file = root / "GTAGS"
 
@@ -6,7 +6,7 @@ import argparse
 from typing import Any
 
 
-def register(subparsers: argparse._SubParsersAction) -> None:
+def register(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
     """Register the ``index`` subcommand and its sub-actions."""
     idx = subparsers.add_parser("index", help="Manage GNU Global indexes")
     idx_sub = idx.add_subparsers(dest="action")
@@ -59,6 +59,8 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         help="Fail if index doesn't exist instead of auto-creating",
     )
 
+    return idx
+
 
 def run(args: argparse.Namespace) -> dict[str, Any]:
     """Dispatch to the appropriate index action."""
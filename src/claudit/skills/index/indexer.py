@@ -8,19 +8,30 @@ for C, Java, and Python without heuristic brace/indent counting.
 
 from __future__ import annotations
 
-import json as _json
+import functools
 import os
 import re
 import shutil
 import subprocess
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
 from claudit.errors import (
     GlobalNotFoundError,
     CtagsNotFoundError,
     IndexingError,
 )
+from claudit.jsonio import loads
+
+# "<path>:<line>:<source>" lines from `global --result=grep`; the lazy path
+# match keeps a colon in the source text out of the path
+_GREP_RE = re.compile(r"^(.+?):(\d+):")
+
+# ctags kinds that denote a function definition (C/Java/Python)
+_FUNCTION_KINDS: frozenset[str] = frozenset({"function", "method", "def"})
 
 
 @dataclass
@@ -42,9 +53,15 @@ class FunctionBody:
     source: str
 
 
+@functools.lru_cache(maxsize=None)
+def which(name: str) -> str | None:
+    """Cached ``shutil.which``: PATH is searched once per tool per process."""
+    return shutil.which(name)
+
+
 def _check_global() -> str:
     """Return path to `global` binary, or raise."""
-    path = shutil.which("global")
+    path = which("global")
     if path is None:
         raise GlobalNotFoundError()
     return path
@@ -52,7 +69,7 @@ def _check_global() -> str:
 
 def _check_gtags() -> str:
     """Return path to `gtags` binary, or raise."""
-    path = shutil.which("gtags")
+    path = which("gtags")
     if path is None:
         raise GlobalNotFoundError()
     return path
@@ -60,7 +77,7 @@ def _check_gtags() -> str:
 
 def _check_ctags() -> str:
     """Return path to Universal Ctags binary, or raise."""
-    path = shutil.which("ctags")
+    path = which("ctags")
     if path is None:
         raise CtagsNotFoundError()
     return path
@@ -68,31 +85,47 @@ def _check_ctags() -> str:
 
 def ensure_index(project_dir: str) -> Path:
     """Run gtags if GTAGS does not already exist. Return project root Path."""
+    # The usual case: an existing GTAGS also proves the root is a directory,
+    # so one stat covers both checks
+    root = resolve_project(project_dir)
+    if os.path.exists(root / "GTAGS"):
+        return root
+
     root = _find_project_root(project_dir)
-    gtags_file = root / "GTAGS"
-
-    if not gtags_file.exists():
-        gtags_bin = _check_gtags()
-        env = os.environ.copy()
-        env["GTAGSFORCECPP"] = "1"  # treat .h as C++
-        result = subprocess.run(
-            [gtags_bin],
-            cwd=str(root),
-            capture_output=True,
-            text=True,
-            env=env,
+    gtags_bin = _check_gtags()
+    env = os.environ.copy()
+    env["GTAGSFORCECPP"] = "1"  # treat .h as C++
+    result = subprocess.run(
+        [gtags_bin],
+        cwd=str(root),
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise IndexingError(
+            f"gtags failed (exit {result.returncode}):\n{result.stderr}"
         )
-        if result.returncode != 0:
-            raise IndexingError(
-                f"gtags failed (exit {result.returncode}):\n{result.stderr}"
-            )
-
     return root
 
 
+def resolve_project(project_dir: str) -> Path:
+    """Return ``Path(project_dir).resolve()``, memoized per absolute path.
+
+    Saves the realpath() walk when one command resolves the same project
+    for every file or function it touches.
+    """
+    return _resolve_abs(os.path.abspath(project_dir))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_abs(abs_dir: str) -> Path:
+    return Path(abs_dir).resolve()
+
+
 def _find_project_root(project_dir: str) -> Path:
     """Resolve the project root directory."""
-    p = Path(project_dir).resolve()
+    p = resolve_project(project_dir)
     if not p.is_dir():
         raise FileNotFoundError(f"Project directory does not exist: {p}")
     return p
@@ -100,25 +133,43 @@ def _find_project_root(project_dir: str) -> Path:
 
 def gtags_mtime(project_dir: str) -> float:
     """Return mtime of GTAGS file, or 0 if absent."""
-    gtags = Path(project_dir).resolve() / "GTAGS"
-    if gtags.exists():
-        return gtags.stat().st_mtime
-    return 0.0
+    try:
+        return os.stat(resolve_project(project_dir) / "GTAGS").st_mtime
+    except OSError:
+        return 0.0
 
 
 def find_definition(name: str, project_dir: str) -> list[FunctionDef]:
-    """Use `global -d` to find definition(s) of a symbol."""
+    """Use `global -d` to find definition(s) of a symbol.
+
+    Results are memoized on (name, project, GTAGS mtime), so highlighting a
+    path or extracting many functions queries Global once per name until the
+    index is rebuilt.
+    """
+    root = resolve_project(project_dir)
+    return list(_find_definition(name, str(root), gtags_mtime(str(root))))
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_definition(
+    name: str, root: str, gtags_mtime: float
+) -> tuple[FunctionDef, ...]:
     global_bin = _check_global()
-    root = Path(project_dir).resolve()
     result = subprocess.run(
         [global_bin, "-d", "--result=grep", name],
-        cwd=str(root),
+        cwd=root,
         capture_output=True,
         text=True,
     )
+    return tuple(_parse_grep_output(result.stdout, name))
+
+
+def _parse_grep_output(stdout: str, name: str) -> list[FunctionDef]:
+    """Turn `global --result=grep` output into FunctionDefs for *name*."""
+    match = _GREP_RE.match
     defs: list[FunctionDef] = []
-    for line in result.stdout.strip().splitlines():
-        m = re.match(r"^(.+?):(\d+):", line)
+    for line in stdout.splitlines():
+        m = match(line)
         if m:
             defs.append(
                 FunctionDef(name=name, file=m.group(1), line=int(m.group(2)))
@@ -126,24 +177,95 @@ def find_definition(name: str, project_dir: str) -> list[FunctionDef]:
     return defs
 
 
+def _parse_ctags_output(stdout: str) -> list[FunctionDef]:
+    """Turn `global --result=ctags` output into FunctionDefs.
+
+    Each line is ``<name>\t<path>\t<line>``.  The path is whatever lies
+    between the first and last tab, so paths containing spaces (or tabs)
+    come through whole.
+    """
+    defs: list[FunctionDef] = []
+    for line in stdout.splitlines():
+        name, sep, rest = line.partition("\t")
+        path, sep2, line_no = rest.rpartition("\t")
+        if not (sep and sep2 and path):
+            continue
+        try:
+            line_no_int = int(line_no)
+        except ValueError:
+            continue
+        defs.append(FunctionDef(name=name, file=path, line=line_no_int))
+    return defs
+
+
+def find_all_definitions(project_dir: str) -> dict[str, FunctionDef]:
+    """Use a single `global -d` query to map every symbol to its first definition.
+
+    Equivalent to calling :func:`find_definition` for each symbol and keeping
+    ``defs[0]``, but with one subprocess instead of one per symbol.
+    """
+    global_bin = _check_global()
+    root = resolve_project(project_dir)
+    result = subprocess.run(
+        [global_bin, "-d", "--result=ctags", ".*"],
+        cwd=str(root),
+        capture_output=True,
+    )
+    # The output covers the whole project, so it is decoded in one pass
+    # rather than through text=True's locale codec and newline translation.
+    defs: dict[str, FunctionDef] = {}
+    for func_def in _parse_ctags_output(result.stdout.decode("utf-8", "replace")):
+        defs.setdefault(func_def.name, func_def)
+    return defs
+
+
+def find_definitions(
+    names: list[str], project_dir: str
+) -> dict[str, list[FunctionDef]]:
+    """Use a single `global -d` query to find the definitions of several symbols.
+
+    Equivalent to calling :func:`find_definition` for each name, but Global
+    starts (and maps its tag files) once for the whole batch.  Names with no
+    definition are absent from the result.
+    """
+    unique = list(dict.fromkeys(names))
+    if not unique:
+        return {}
+    global_bin = _check_global()
+    root = resolve_project(project_dir)
+    pattern = "^(" + "|".join(re.escape(name) for name in unique) + ")$"
+    result = subprocess.run(
+        [global_bin, "-d", "--result=ctags", "-e", pattern],
+        cwd=str(root),
+        capture_output=True,
+        text=True,
+    )
+    wanted = set(unique)
+    defs: dict[str, list[FunctionDef]] = {}
+    for func_def in _parse_ctags_output(result.stdout):
+        if func_def.name in wanted:
+            defs.setdefault(func_def.name, []).append(func_def)
+    return defs
+
+
 def find_references(name: str, project_dir: str) -> list[FunctionDef]:
     """Use `global -r` to find references to a symbol."""
     global_bin = _check_global()
-    root = Path(project_dir).resolve()
+    root = resolve_project(project_dir)
     result = subprocess.run(
         [global_bin, "-r", "--result=grep", name],
         cwd=str(root),
         capture_output=True,
         text=True,
     )
-    refs: list[FunctionDef] = []
-    for line in result.stdout.strip().splitlines():
-        m = re.match(r"^(.+?):(\d+):", line)
-        if m:
-            refs.append(
-                FunctionDef(name=name, file=m.group(1), line=int(m.group(2)))
-            )
-    return refs
+    return _parse_grep_output(result.stdout, name)
+
+
+# path -> (mtime_ns, tags), least recently used first.  A plain LRU dict
+# rather than functools.lru_cache so batch runs can fill it per file.
+_CTAGS_CACHE_SIZE = 256
+_ctags_cache: OrderedDict[str, tuple[int, list[dict]]] = OrderedDict()
+_ctags_lock = threading.Lock()
 
 
 def get_ctags_tags(filepath: str) -> list[dict]:
@@ -151,41 +273,93 @@ def get_ctags_tags(filepath: str) -> list[dict]:
 
     Each element is a dict with at least: name, path, line, kind.
     Function/method tags also have an ``end`` key with the closing line number.
+
+    Results are memoized on (path, mtime), so extracting bodies and
+    signatures for many functions in one file runs ctags once.  Treat the
+    returned list as read-only.
     """
+    filepath = str(filepath)
+    return get_ctags_tags_many([filepath])[filepath]
+
+
+def get_ctags_tags_many(filepaths: list[str]) -> dict[str, list[dict]]:
+    """Batch form of :func:`get_ctags_tags`, keyed by the given paths.
+
+    Files not already memoized for their current mtime go through a single
+    ctags run, so a call path spanning many files costs one subprocess.
+    """
+    tags_by_file: dict[str, list[dict]] = {}
+    stale: dict[str, int] = {}
+    with _ctags_lock:
+        for filepath in map(str, filepaths):
+            try:
+                mtime_ns = os.stat(filepath).st_mtime_ns
+            except OSError:
+                mtime_ns = -1
+            cached = _ctags_cache.get(filepath)
+            if cached is not None and cached[0] == mtime_ns:
+                _ctags_cache.move_to_end(filepath)
+                tags_by_file[filepath] = cached[1]
+            else:
+                stale[filepath] = mtime_ns
+
+    if stale:
+        fresh = _run_ctags(list(stale))
+        with _ctags_lock:
+            for filepath, mtime_ns in stale.items():
+                tags = fresh.get(filepath, [])
+                _ctags_cache[filepath] = (mtime_ns, tags)
+                _ctags_cache.move_to_end(filepath)
+                tags_by_file[filepath] = tags
+            while len(_ctags_cache) > _CTAGS_CACHE_SIZE:
+                _ctags_cache.popitem(last=False)
+
+    return tags_by_file
+
+
+def _run_ctags(filepaths: list[str]) -> dict[str, list[dict]]:
+    """Run ctags once over *filepaths* and group its tags by file."""
     ctags_bin = _check_ctags()
     result = subprocess.run(
         [
             ctags_bin,
             "--output-format=json",
             "--fields=+ne",
+            "--extras=-p",
             "-o", "-",
-            filepath,
+            *filepaths,
         ],
         capture_output=True,
-        text=True,
     )
-    tags: list[dict] = []
+    single = filepaths[0] if len(filepaths) == 1 else None
+    tags_by_file: dict[str, list[dict]] = {}
+    # The JSON loader takes bytes, so the output is never decoded as a whole
     for raw_line in result.stdout.splitlines():
-        raw_line = raw_line.strip()
-        if not raw_line:
+        # Every JSON record starts with "{"; skip anything else unparsed
+        if not raw_line.startswith(b"{"):
             continue
         try:
-            tag = _json.loads(raw_line)
-            if isinstance(tag, dict) and tag.get("_type") == "tag":
-                tags.append(tag)
-        except _json.JSONDecodeError:
+            tag = loads(raw_line)
+        except ValueError:
             continue
-    return tags
+        if isinstance(tag, dict) and tag.get("_type") == "tag":
+            # ctags reports each tag's path as it was given on the command line
+            tags_by_file.setdefault(single or tag.get("path"), []).append(tag)
+    return tags_by_file
 
 
-def _ctags_function_bounds(
-    filepath: str, func_name: str, start_line: int
-) -> tuple[int, int] | None:
-    """Look up (start, end) line numbers for *func_name* at *start_line*.
+def iter_function_tags(tags: list[dict]) -> Iterator[dict]:
+    """Yield the named function/method/def tags from ctags output."""
+    return (
+        tag for tag in tags
+        if tag.get("kind") in _FUNCTION_KINDS and tag.get("name")
+    )
 
-    Returns ``None`` if ctags doesn't report an ``end`` for this tag.
-    """
-    tags = get_ctags_tags(filepath)
+
+def _match_function_bounds(
+    tags: list[dict], func_name: str, start_line: int
+) -> tuple[int, int] | None:
+    """Pick (start, end) for *func_name* at *start_line* from ctags output."""
     # Match on name + line; kind must be function/method/def
     for tag in tags:
         if (
@@ -203,6 +377,56 @@ def _ctags_function_bounds(
     return None
 
 
+def _ctags_function_bounds(
+    filepath: str, func_name: str, start_line: int
+) -> tuple[int, int] | None:
+    """Look up (start, end) line numbers for *func_name* at *start_line*.
+
+    Returns ``None`` if ctags doesn't report an ``end`` for this tag.
+    """
+    return _match_function_bounds(get_ctags_tags(filepath), func_name, start_line)
+
+
+def read_source_lines(filepath: str | Path) -> tuple[str, ...]:
+    """Return the lines of *filepath*, memoized on (path, mtime).
+
+    Several functions usually live in the same file, so harness and graph
+    queries hit the same sources repeatedly; an edit changes the mtime and
+    forces a re-read.  Returns an empty tuple if the file cannot be read.
+    """
+    try:
+        mtime_ns = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return ()
+    return _read_source_lines(str(filepath), mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_source_lines(filepath: str, mtime_ns: int) -> tuple[str, ...]:
+    try:
+        # Bytes + one decode skips TextIOWrapper's newline translation;
+        # splitlines() handles \r\n and \r the same way.
+        data = Path(filepath).read_bytes()
+    except OSError:
+        return ()
+    return tuple(data.decode("utf-8", "replace").splitlines())
+
+
+def _slice_body(
+    file: str, lines: tuple[str, ...], start_line: int, end_line: int
+) -> FunctionBody:
+    """Build a FunctionBody from 1-based inclusive bounds over *lines*."""
+    # Clamp to file length
+    start_idx = max(start_line - 1, 0)
+    end_idx = min(end_line, len(lines))
+    return FunctionBody(
+        file=file,
+        start_line=start_line,
+        end_line=end_line,
+        source="\n".join(lines[start_idx:end_idx]),
+    )
+
+
 def get_function_body(
     func_def: FunctionDef,
     project_dir: str,
@@ -213,7 +437,7 @@ def get_function_body(
     Runs ``ctags --output-format=json --fields=+ne`` on the file to get
     precise start/end line numbers, then slices the source.
     """
-    root = Path(project_dir).resolve()
+    root = resolve_project(project_dir)
     filepath = root / func_def.file
     if not filepath.exists():
         return None
@@ -224,29 +448,54 @@ def get_function_body(
     if bounds is None:
         return None
 
-    start_line, end_line = bounds
-    lines = filepath.read_text(errors="replace").splitlines()
-    # Clamp to file length
-    start_idx = max(start_line - 1, 0)
-    end_idx = min(end_line, len(lines))
-    source = "\n".join(lines[start_idx:end_idx])
+    return _slice_body(func_def.file, read_source_lines(filepath), *bounds)
 
-    return FunctionBody(
-        file=func_def.file,
-        start_line=start_line,
-        end_line=end_line,
-        source=source,
-    )
+
+def get_function_bodies(
+    func_defs: list[FunctionDef],
+    project_dir: str,
+) -> dict[str, FunctionBody]:
+    """Batch form of :func:`get_function_body`, keyed by function name.
+
+    Definitions are grouped by file so each file is read from disk once,
+    and all files go through a single ctags run.  Functions without ctags
+    bounds are omitted.
+    """
+    root = resolve_project(project_dir)
+    by_file: dict[str, list[FunctionDef]] = {}
+    for func_def in func_defs:
+        by_file.setdefault(func_def.file, []).append(func_def)
+
+    paths = {
+        relpath: str(root / relpath)
+        for relpath in by_file
+        if (root / relpath).exists()
+    }
+    if not paths:
+        return {}
+    tags_by_file = get_ctags_tags_many(list(paths.values()))
+
+    bodies: dict[str, FunctionBody] = {}
+    for relpath, filepath in paths.items():
+        tags = tags_by_file[filepath]
+        lines = read_source_lines(filepath)
+        defs = by_file[relpath]
+        for func_def in defs:
+            bounds = _match_function_bounds(tags, func_def.name, func_def.line)
+            if bounds is not None:
+                bodies[func_def.name] = _slice_body(relpath, lines, *bounds)
+    return bodies
 
 
 def list_symbols(project_dir: str) -> list[str]:
     """Use `global -c` to list all completions (symbol names)."""
     global_bin = _check_global()
-    root = Path(project_dir).resolve()
+    root = resolve_project(project_dir)
     result = subprocess.run(
         [global_bin, "-c", ""],
         cwd=str(root),
         capture_output=True,
-        text=True,
     )
-    return [s for s in result.stdout.strip().splitlines() if s]
+    return [
+        s for s in result.stdout.decode("utf-8", "replace").splitlines() if s
+    ]
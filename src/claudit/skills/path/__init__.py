@@ -13,8 +13,13 @@ from typing import Any
 from claudit.errors import GraphNotFoundError
 from claudit.lang import load_overrides
 from claudit.skills.graph import build as build_graph
-from claudit.skills.graph.cache import load_call_graph
-from claudit.skills.path.pathfinder import find_all_paths, annotate_path
+from claudit.skills.graph.cache import (
+    load_call_graph,
+    load_paths,
+    load_reverse_call_graph,
+    save_paths,
+)
+from claudit.skills.path.pathfinder import find_all_paths, annotate_paths
 
 
 def find(
@@ -50,13 +55,25 @@ def find(
         if graph is None:
             graph = {}
 
-    raw_paths = find_all_paths(graph, source, target, max_depth)
+    # Searches over a cached graph are cached too; a rebuilt graph drops them
+    raw_paths = None
+    if cache_used:
+        raw_paths = load_paths(project_dir, source, target, max_depth)
+    if raw_paths is None:
+        # The cached reverse index lets the search prune dead branches
+        raw_paths = find_all_paths(
+            graph,
+            source,
+            target,
+            max_depth,
+            callers=load_reverse_call_graph(project_dir),
+        )
+        if cache_used:
+            save_paths(project_dir, source, target, max_depth, raw_paths)
 
-    paths = []
-    for rp in raw_paths:
-        if annotate:
-            cp = annotate_path(rp, project_dir)
-            paths.append({
+    if annotate:
+        paths = [
+            {
                 "hops": [
                     {
                         "function": h.function,
@@ -67,12 +84,11 @@ def find(
                     for h in cp.hops
                 ],
                 "length": len(cp.hops),
-            })
-        else:
-            paths.append({
-                "hops": rp,
-                "length": len(rp),
-            })
+            }
+            for cp in annotate_paths(raw_paths, project_dir)
+        ]
+    else:
+        paths = [{"hops": rp, "length": len(rp)} for rp in raw_paths]
 
     return {
         "source": source,
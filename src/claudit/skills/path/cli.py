@@ -6,7 +6,7 @@ import argparse
 from typing import Any
 
 
-def register(subparsers: argparse._SubParsersAction) -> None:
+def register(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
     """Register the ``path`` subcommand and its sub-actions."""
     pth = subparsers.add_parser("path", help="Call path operations")
     pth_sub = pth.add_subparsers(dest="action")
@@ -44,6 +44,8 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         help="Fail if graph doesn't exist instead of auto-building",
     )
 
+    return pth
+
 
 def run(args: argparse.Namespace) -> dict[str, Any]:
     """Dispatch to the appropriate path action."""
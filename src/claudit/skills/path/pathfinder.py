@@ -9,7 +9,11 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, field
 
-from claudit.skills.index.indexer import find_definition, FunctionDef
+from claudit.skills.index.indexer import (
+    find_definitions,
+    read_source_lines,
+    resolve_project,
+)
 
 
 @dataclass
@@ -34,77 +38,150 @@ def find_all_paths(
     source: str,
     target: str,
     max_depth: int = 10,
+    callers: dict[str, list[str]] | None = None,
 ) -> list[list[str]]:
     """BFS to find all paths from source to target, up to max_depth hops.
 
+    *callers* is the reverse (callee -> callers) graph, e.g. the cached
+    index.  When given, branches that cannot reach the target within the
+    remaining depth are pruned; the result is the same either way.
+
     Returns list of paths, where each path is a list of function names.
     """
     if source == target:
         return [[source]]
 
+    # Lower bound on the edges from each node to the target; a callee that
+    # cannot reach the target within the remaining depth is never queued
+    remaining: dict[str, int] = {}
+    unknown = 0
+    if callers is not None:
+        remaining, unknown = _distances_to(callers, target, max_depth)
+        if remaining.get(source, unknown) > max_depth:
+            return []
+
     results: list[list[str]] = []
-    queue: deque[list[str]] = deque([[source]])
+    # Queue entries index into ``nodes``, which holds (name, parent index,
+    # path length).  A partial path is rebuilt from parent pointers once per
+    # expanded node instead of being copied for every edge.
+    nodes: list[tuple[str, int, int]] = [(source, -1, 1)]
+    queue: deque[int] = deque([0])
 
     while queue:
-        path = queue.popleft()
+        index = queue.popleft()
+        current, _, length = nodes[index]
 
-        if len(path) > max_depth:
+        if length > max_depth:
             continue
 
-        current = path[-1]
-        callees = graph.get(current, [])
+        callees = graph.get(current)
+        if not callees:
+            continue
 
+        path = _rebuild_path(nodes, index)
+        on_path = set(path)
         for callee in callees:
-            if callee in path:
+            if callee in on_path:
                 # Skip cycles
                 continue
-            new_path = path + [callee]
             if callee == target:
-                results.append(new_path)
-            elif len(new_path) <= max_depth:
-                queue.append(new_path)
+                results.append(path + [callee])
+            elif length + max(remaining.get(callee, unknown), 1) <= max_depth:
+                nodes.append((callee, index, length + 1))
+                queue.append(len(nodes) - 1)
 
     return results
 
 
+def _distances_to(
+    callers: dict[str, list[str]], target: str, max_depth: int
+) -> tuple[dict[str, int], int]:
+    """Backward BFS from *target* over half of *max_depth*.
+
+    Returns exact edge counts for the nodes it reached, plus a lower bound
+    for every other node: one past the horizon, or past *max_depth* if the
+    search ran out of callers first.  Searching only half the depth keeps
+    the cost near that of the forward search it prunes.
+    """
+    horizon = max_depth // 2
+    distance = {target: 0}
+    frontier = [target]
+    for depth in range(1, horizon + 1):
+        next_frontier: list[str] = []
+        for node in frontier:
+            for caller in callers.get(node, ()):
+                if caller not in distance:
+                    distance[caller] = depth
+                    next_frontier.append(caller)
+        if not next_frontier:
+            return distance, max_depth + 1
+        frontier = next_frontier
+    return distance, horizon + 1
+
+
+def _rebuild_path(nodes: list[tuple[str, int, int]], index: int) -> list[str]:
+    """Follow parent pointers from ``nodes[index]`` back to the source."""
+    path: list[str] = []
+    while index >= 0:
+        name, index, _ = nodes[index]
+        path.append(name)
+    path.reverse()
+    return path
+
+
 def annotate_path(
     path: list[str],
     project_dir: str,
 ) -> CallPath:
     """Add file/line/snippet info to each hop in a path."""
-    hops: list[Hop] = []
-    for func_name in path:
-        defs = find_definition(func_name, project_dir)
+    return annotate_paths([path], project_dir)[0]
+
+
+def annotate_paths(
+    paths: list[list[str]],
+    project_dir: str,
+) -> list[CallPath]:
+    """Annotate several paths, looking up each distinct function once.
+
+    Paths from one search share most of their hops; all names go to Global
+    in a single query and each hop is built once, so repeated functions
+    share the same :class:`Hop`.
+    """
+    defs_by_name = find_definitions(
+        [func_name for path in paths for func_name in path], project_dir
+    )
+    hops_by_name: dict[str, Hop] = {}
+    for func_name in dict.fromkeys(
+        func_name for path in paths for func_name in path
+    ):
+        defs = defs_by_name.get(func_name)
         if defs:
             d = defs[0]
             # Read the line for a snippet
             snippet = _read_line(project_dir, d.file, d.line)
-            hops.append(
-                Hop(
-                    function=func_name,
-                    file=d.file,
-                    line=d.line,
-                    snippet=snippet,
-                )
+            hops_by_name[func_name] = Hop(
+                function=func_name,
+                file=d.file,
+                line=d.line,
+                snippet=snippet,
             )
         else:
-            hops.append(
-                Hop(function=func_name, file="<unknown>", line=0, snippet="")
+            hops_by_name[func_name] = Hop(
+                function=func_name, file="<unknown>", line=0, snippet=""
             )
-    return CallPath(hops=hops)
+    return [
+        CallPath(hops=[hops_by_name[func_name] for func_name in path])
+        for path in paths
+    ]
 
 
 def _read_line(project_dir: str, filepath: str, line_no: int) -> str:
-    """Read a single line from a file."""
-    from pathlib import Path
-
-    full = Path(project_dir).resolve() / filepath
-    if not full.exists():
-        return ""
-    try:
-        lines = full.read_text(errors="replace").splitlines()
-        if 0 < line_no <= len(lines):
-            return lines[line_no - 1].strip()
-    except OSError:
-        pass
+    """Read a single line from a file.
+
+    Goes through the shared (path, mtime) line cache, so hops that live in
+    the same file decode it once.
+    """
+    lines = read_source_lines(resolve_project(project_dir) / filepath)
+    if 0 < line_no <= len(lines):
+        return lines[line_no - 1].strip()
     return ""
@@ -6,6 +6,23 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
+from claudit.skills.harness.signature_extractor import _function_tags
+from claudit.skills.index.indexer import _ctags_cache, _find_definition, which
+
+
+@pytest.fixture(autouse=True)
+def _clear_tool_cache():
+    """Tests patch shutil.which and subprocess freely; never serve cached
+    tool paths, Global lookups or ctags output from another test."""
+    caches = (which, _find_definition, _function_tags)
+    for cached in caches:
+        cached.cache_clear()
+    _ctags_cache.clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+    _ctags_cache.clear()
+
 
 @pytest.fixture
 def c_project(tmp_path):
@@ -95,7 +112,7 @@ def mock_global():
             # global -c ""
             if "-c" in cmd:
                 output = "\n".join(self.symbols) + "\n" if self.symbols else ""
-                return MagicMock(stdout=output, returncode=0)
+                return MagicMock(stdout=output.encode(), returncode=0)
 
             return MagicMock(stdout="", returncode=0)
 
@@ -1,8 +1,13 @@
 """Tests for the CLI dispatcher."""
 
 import json
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import claudit
 from claudit.cli import main
 
 
@@ -23,7 +28,7 @@ class TestCLIDispatch:
 
     def test_index_list_symbols(self, tmp_path, capsys):
         (tmp_path / "GTAGS").write_text("fake")
-        mock_result = MagicMock(stdout="foo\nbar\n", returncode=0)
+        mock_result = MagicMock(stdout=b"foo\nbar\n", returncode=0)
         with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
              patch("subprocess.run", return_value=mock_result):
             ret = main(["index", "list-symbols", str(tmp_path)])
@@ -55,3 +60,20 @@ class TestCLIDispatch:
         out = capsys.readouterr().out
         for skill in ("index", "graph", "path", "highlight"):
             assert skill in out
+
+    def test_help_does_not_import_skills(self):
+        code = (
+            "import sys\n"
+            "from claudit.cli import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print([m for m in sys.modules if m.startswith('claudit.skills')])\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(claudit.__file__).parents[1]))
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True, env=env,
+        ).stdout
+        assert out.strip().splitlines()[-1] == "[]"
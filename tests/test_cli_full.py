@@ -22,12 +22,12 @@ class TestCLITopLevel:
             main(["nonexistent_command"])
 
     def test_missing_action_shows_help(self, capsys):
-        """Subcommand without action triggers help."""
-        # This should print help and return 1 (or SystemExit from --help)
-        try:
-            ret = main(["graph"])
-        except SystemExit:
-            pass  # --help may cause SystemExit
+        """Subcommand without action prints its help and returns 1."""
+        ret = main(["graph"])
+        assert ret == 1
+        out = capsys.readouterr().out
+        assert "usage: claudit graph" in out
+        assert "callers" in out
 
 
 # ---------------------------------------------------------------------------
@@ -43,6 +43,19 @@ class TestGraphCLI:
         assert output["graph"] == graph
         assert output["node_count"] == 2
 
+    def test_graph_show_jsonl(self, tmp_path, capsys):
+        graph = {"main": ["helper"], "helper": []}
+        with patch("claudit.skills.graph._require_graph", return_value=graph):
+            ret = main(["graph", "show", str(tmp_path), "--jsonl"])
+        assert ret == 0
+        lines = capsys.readouterr().out.splitlines()
+        records = [json.loads(line) for line in lines]
+        assert records[0] == {"node_count": 2, "edge_count": 1}
+        assert records[1:] == [
+            {"caller": "main", "callees": ["helper"]},
+            {"caller": "helper", "callees": []},
+        ]
+
     def test_graph_callers(self, tmp_path, capsys):
         graph = {"main": ["helper"], "init": ["helper"]}
         with patch("claudit.skills.graph._require_graph", return_value=graph):
@@ -64,6 +77,21 @@ class TestGraphCLI:
         output = json.loads(capsys.readouterr().out)
         assert output["status"] == "built"
 
+    def test_graph_build_passes_jobs(self, tmp_path, capsys):
+        (tmp_path / "GTAGS").write_text("fake")
+        with patch("claudit.skills.graph.load_call_graph", return_value=None), \
+             patch("claudit.skills.graph.build_call_graph", return_value={}) as mock_build, \
+             patch("claudit.skills.graph.save_call_graph"), \
+             patch("claudit.skills.graph.ensure_index"):
+            ret = main(["graph", "build", str(tmp_path), "--language", "c", "--jobs", "4"])
+        assert ret == 0
+        assert mock_build.call_args.kwargs["jobs"] == 4
+
+    def test_graph_build_rejects_negative_jobs(self, tmp_path, capsys):
+        with pytest.raises(SystemExit):
+            main(["graph", "build", str(tmp_path), "--jobs", "-1"])
+        assert "--jobs" in capsys.readouterr().err
+
 
 # ---------------------------------------------------------------------------
 # index CLI subcommands
@@ -131,7 +159,7 @@ class TestPathCLI:
 
         with patch("claudit.skills.path.load_call_graph", return_value=graph), \
              patch("claudit.skills.path.load_overrides", return_value=None), \
-             patch("claudit.skills.path.pathfinder.find_definition", return_value=[]):
+             patch("claudit.skills.path.pathfinder.find_definitions", return_value={}):
             ret = main(["path", "find", "main", "helper", str(tmp_path)])
         assert ret == 0
         output = json.loads(capsys.readouterr().out)
@@ -192,14 +220,17 @@ class TestHighlightCLI:
         def mock_find_def(name, proj):
             return [FunctionDef(name=name, file=f"{name}.c", line=1)]
 
-        def mock_get_body(func_def, proj, lang):
-            return FunctionBody(
-                file=func_def.file, start_line=1, end_line=3,
-                source=f"void {func_def.name}() {{\n    next_func();\n}}",
-            )
+        def mock_get_bodies(func_defs, proj):
+            return {
+                d.name: FunctionBody(
+                    file=d.file, start_line=1, end_line=3,
+                    source=f"void {d.name}() {{\n    next_func();\n}}",
+                )
+                for d in func_defs
+            }
 
         with patch("claudit.skills.highlight.renderer.find_definition", side_effect=mock_find_def), \
-             patch("claudit.skills.highlight.renderer.get_function_body", side_effect=mock_get_body), \
+             patch("claudit.skills.highlight.renderer.get_function_bodies", side_effect=mock_get_bodies), \
              patch("claudit.lang.detect_language", return_value="c"):
             ret = main(["highlight", "path", "main", "helper", "--project-dir", str(tmp_path)])
         assert ret == 0
@@ -255,13 +286,55 @@ class TestHarnessCLI:
         output = json.loads(capsys.readouterr().out)
         assert len(output["extracted"]) == 1
 
+    def test_harness_extract_output_file(self, c_project, tmp_path, capsys):
+        from claudit.skills.harness import ExtractedFunction
+
+        funcs = [
+            ExtractedFunction(
+                name=name, file="util.c", start_line=1, end_line=1,
+                source=f"void {name}(void) {{}}", signature=f"void {name}(void)",
+                language="c",
+            )
+            for name in ("helper", "process")
+        ]
+        out_file = tmp_path / "harness.c"
+        with patch("claudit.skills.harness.extract_functions_from_file", return_value=funcs):
+            ret = main([
+                "harness", "extract", "--file", "util.c", str(c_project),
+                "--output", str(out_file),
+            ])
+        assert ret == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["output"] == str(out_file)
+        assert [e["function"] for e in output["extracted"]] == ["helper", "process"]
+        assert all("source" not in e for e in output["extracted"])
+        assert out_file.read_text() == (
+            "void helper(void) {}\n\nvoid process(void) {}\n\n"
+        )
+
+    def test_harness_extract_summary(self, c_project, capsys):
+        from claudit.skills.harness import ExtractedFunction
+
+        funcs = [
+            ExtractedFunction(
+                name="helper", file="util.c", start_line=3, end_line=5,
+                source="void helper(int x) {}", signature="void helper(int x)",
+                language="c",
+            ),
+        ]
+        with patch("claudit.skills.harness.extract_functions_from_file", return_value=funcs):
+            main(["harness", "extract", "--file", "util.c", str(c_project), "--summary"])
+        entry = json.loads(capsys.readouterr().out)["extracted"][0]
+        assert "source" not in entry
+        assert entry["signature"] == "void helper(int x)"
+
     def test_harness_list_functions(self, c_project, capsys):
         funcs_list = [
             {"name": "process", "line": 3, "kind": "function"},
             {"name": "main", "line": 7, "kind": "function"},
         ]
 
-        with patch("claudit.skills.harness.list_functions_in_file", return_value=funcs_list):
+        with patch("claudit.skills.harness.cli.list_functions_in_file", return_value=funcs_list):
             ret = main(["harness", "list-functions", str(c_project), "--file", "main.c"])
         assert ret == 0
         output = json.loads(capsys.readouterr().out)
@@ -277,13 +350,46 @@ class TestHarnessCLI:
             dependency_map={"process": ["helper", "printf"]},
         )
 
-        with patch("claudit.skills.harness.analyze_dependencies", return_value=deps):
+        with patch("claudit.skills.harness.cli.analyze_dependencies", return_value=deps):
             ret = main(["harness", "analyze-deps", str(c_project), "--functions", "process"])
         assert ret == 0
         output = json.loads(capsys.readouterr().out)
         assert "helper" in output["stub_functions"]
         assert "printf" in output["excluded_stdlib"]
 
+    def test_harness_analyze_deps_no_sort(self, c_project, capsys):
+        from claudit.skills.harness import DependencySet
+
+        deps = DependencySet(stub_functions={"b", "a"}, excluded_stdlib={"printf"})
+        with patch("claudit.skills.harness.cli.analyze_dependencies", return_value=deps):
+            ret = main([
+                "harness", "analyze-deps", str(c_project),
+                "--functions", "process", "--no-sort",
+            ])
+        assert ret == 0
+        output = json.loads(capsys.readouterr().out)
+        assert sorted(output["stub_functions"]) == ["a", "b"]
+        assert output["excluded_stdlib"] == ["printf"]
+
+    def test_harness_analyze_deps_functions_file(self, c_project, tmp_path, capsys):
+        from claudit.skills.harness import DependencySet
+
+        names = tmp_path / "names.txt"
+        names.write_text("process\n\nhelper\nprocess\n")
+        with patch(
+            "claudit.skills.harness.cli.analyze_dependencies",
+            return_value=DependencySet(),
+        ) as mock_analyze:
+            ret = main([
+                "harness", "analyze-deps", str(c_project),
+                "--functions-file", str(names),
+            ])
+        assert ret == 0
+        # One analysis for the whole batch, names deduped in file order
+        mock_analyze.assert_called_once_with(
+            str(c_project), ["process", "helper"], depth=1, max_stubs=None
+        )
+
     def test_harness_get_signature(self, c_project, capsys):
         from claudit.skills.harness import FunctionSignature, Parameter
 
@@ -296,7 +402,7 @@ class TestHarnessCLI:
             class_name=None,
         )
 
-        with patch("claudit.skills.harness.get_function_signature", return_value=sig):
+        with patch("claudit.skills.harness.cli.get_function_signature", return_value=sig):
             ret = main(["harness", "get-signature", str(c_project), "--function", "helper"])
         assert ret == 0
         output = json.loads(capsys.readouterr().out)
@@ -306,7 +412,7 @@ class TestHarnessCLI:
         assert len(output["parameters"]) == 1
 
     def test_harness_get_signature_not_found(self, c_project, capsys):
-        with patch("claudit.skills.harness.get_function_signature", return_value=None):
+        with patch("claudit.skills.harness.cli.get_function_signature", return_value=None):
             ret = main(["harness", "get-signature", str(c_project), "--function", "missing"])
         assert ret == 0
         output = json.loads(capsys.readouterr().out)
@@ -1,15 +1,20 @@
 """Tests for the call graph caching layer."""
 
+import json
 from unittest.mock import patch
 
 from claudit.skills.graph.cache import (
     load_call_graph,
+    load_reverse_call_graph,
     save_call_graph,
     load_global_results,
     save_global_results,
+    load_paths,
+    save_paths,
     _project_hash,
     _cache_dir,
     _cache_key,
+    _read_graph,
 )
 
 
@@ -32,6 +37,62 @@ class TestCallGraphCache:
         with patch("claudit.skills.graph.cache.gtags_mtime", return_value=0.0):
             assert load_call_graph(str(tmp_path)) is None
 
+    def test_reverse_index_saved_alongside(self, tmp_path):
+        project_dir = str(tmp_path)
+        graph = {"a": ["c"], "b": ["c", "d"]}
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, graph)
+            assert load_reverse_call_graph(project_dir) == {
+                "c": ["a", "b"],
+                "d": ["b"],
+            }
+
+    def test_unversioned_cache_is_stale(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+            meta = _cache_dir(project_dir) / "callgraph_meta.json"
+            meta.write_text(json.dumps({"key": _cache_key(project_dir)}))
+            assert load_call_graph(project_dir) is None
+            assert load_reverse_call_graph(project_dir) is None
+
+    def test_repeat_loads_parse_once(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+            first = load_call_graph(project_dir)
+            hits = _read_graph.cache_info().hits
+            second = load_call_graph(project_dir)
+        assert _read_graph.cache_info().hits == hits + 1
+        # Each load hands out its own dict and lists
+        first["a"].append("x")
+        assert second == {"a": ["b"]}
+
+    def test_save_replaces_memoized_graph(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+            assert load_call_graph(project_dir) == {"a": ["b"]}
+            save_call_graph(project_dir, {"a": ["c"]})
+            assert load_call_graph(project_dir) == {"a": ["c"]}
+
+
+class TestCacheLayout:
+    def test_cache_file_is_adjacency_dict(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+        doc = json.loads((_cache_dir(project_dir) / "callgraph.json").read_text())
+        assert doc == {"a": ["b"]}
+
+    def test_loaded_names_are_shared(self, tmp_path):
+        project_dir = str(tmp_path)
+        graph = {"first_caller": ["shared_helper"], "second_caller": ["shared_helper"]}
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, graph)
+            loaded = load_call_graph(project_dir)
+        assert loaded["first_caller"][0] is loaded["second_caller"][0]
+
 
 class TestGlobalResultsCache:
     def test_roundtrip(self, tmp_path):
@@ -49,6 +110,69 @@ class TestGlobalResultsCache:
             assert load_global_results(project_dir) is None
 
 
+class TestPathsCache:
+    def test_roundtrip_per_query(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+            save_paths(project_dir, "a", "c", 10, [["a", "b", "c"]])
+            save_paths(project_dir, "a", "d", 10, [])
+            assert load_paths(project_dir, "a", "c", 10) == [["a", "b", "c"]]
+            assert load_paths(project_dir, "a", "d", 10) == []
+            assert load_paths(project_dir, "a", "c", 3) is None
+
+    def test_stale_returns_none(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+            save_paths(project_dir, "a", "b", 10, [["a", "b"]])
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=200.0):
+            assert load_paths(project_dir, "a", "b", 10) is None
+
+    def test_saving_graph_drops_paths(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+            save_paths(project_dir, "a", "b", 10, [["a", "b"]])
+            save_call_graph(project_dir, {"a": []})
+            assert load_paths(project_dir, "a", "b", 10) is None
+
+    def test_not_saved_without_cached_graph(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_paths(project_dir, "a", "b", 10, [["a", "b"]])
+            assert load_paths(project_dir, "a", "b", 10) is None
+        assert not (tmp_path / ".cache").exists()
+
+    def test_unwritable_cache_is_skipped(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+            with patch("pathlib.Path.write_bytes", side_effect=PermissionError):
+                save_paths(project_dir, "a", "b", 10, [["a", "b"]])
+            assert load_paths(project_dir, "a", "b", 10) is None
+
+    def test_damaged_file_is_a_miss(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0):
+            save_call_graph(project_dir, {"a": ["b"]})
+            (_cache_dir(project_dir) / "paths.json").write_bytes(b'{"key": "')
+            assert load_paths(project_dir, "a", "b", 10) is None
+            save_paths(project_dir, "a", "b", 10, [["a", "b"]])
+            assert load_paths(project_dir, "a", "b", 10) == [["a", "b"]]
+
+    def test_oldest_queries_dropped_past_cap(self, tmp_path):
+        project_dir = str(tmp_path)
+        with patch("claudit.skills.graph.cache.gtags_mtime", return_value=100.0), \
+             patch("claudit.skills.graph.cache.MAX_CACHED_PATH_QUERIES", 2):
+            save_call_graph(project_dir, {"a": ["b"]})
+            for target in ("b", "c", "d"):
+                save_paths(project_dir, "a", target, 10, [])
+            assert load_paths(project_dir, "a", "b", 10) is None
+            assert load_paths(project_dir, "a", "c", 10) == []
+            assert load_paths(project_dir, "a", "d", 10) == []
+
+
 class TestCacheHelpers:
     def test_hash_deterministic(self):
         assert _project_hash("/some/path") == _project_hash("/some/path")
@@ -1,15 +1,19 @@
-"""Tests for call graph extraction — uses real Pygments tokenization."""
+"""Tests for call graph extraction — uses the real call scanner."""
 
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from claudit.skills.index.indexer import FunctionDef, FunctionBody
 from claudit.skills.graph.callgraph import (
     _extract_calls_from_source,
-    _callees_of,
     build_call_graph,
-    _find_enclosing_function,
+    _enclosing_function,
+    _file_definitions,
     _resolve_c_function_pointers,
+    reverse_call_graph,
 )
 
 
@@ -48,40 +52,76 @@ class TestExtractCallsFromSource:
         assert "bar" in calls
         assert "baz" in calls
 
+    def test_python_non_ascii_names(self):
+        source = "def foo():\n    größe(x)\n"
+        assert _extract_calls_from_source(source, "python", {"größe"}) == ["größe"]
+
     def test_java_calls(self):
         source = "void foo() {\n    bar(x);\n    baz();\n}"
         calls = _extract_calls_from_source(source, "java", {"foo", "bar", "baz"})
         assert "bar" in calls
         assert "baz" in calls
 
-    def test_unknown_language_returns_empty(self):
-        assert _extract_calls_from_source("foo()", "rust", {"foo"}) == []
+    def test_c_ignores_comments_and_strings(self):
+        source = (
+            "void foo() {\n"
+            "    /* bar(); */\n"
+            "    // baz();\n"
+            "    puts(\"qux()\");\n"
+            "}"
+        )
+        calls = _extract_calls_from_source(source, "c", {"bar", "baz", "qux", "puts"})
+        assert calls == ["puts"]
 
+    def test_c_ignores_preprocessor_lines(self):
+        source = "void foo() {\n#define WRAP() bar()\n    baz();\n}"
+        calls = _extract_calls_from_source(source, "c", {"bar", "baz"})
+        assert calls == ["baz"]
 
-# ---------------------------------------------------------------------------
-# _callees_of — needs mocked Global but uses real tokenization
-# ---------------------------------------------------------------------------
-class TestCalleesOf:
-    def test_extracts_calls(self):
-        func_def = FunctionDef(name="foo", file="main.c", line=1)
-        func_body = FunctionBody(
-            file="main.c", start_line=1, end_line=3,
-            source="void foo() {\n    bar();\n}",
+    def test_c_ignores_continued_macro_lines(self):
+        source = (
+            "void foo() {\n"
+            "#define WRAP(x) \\\n"
+            "    bar(x); \\\n"
+            "    qux(x)\n"
+            "    baz();\n"
+            "}"
         )
-        with patch("claudit.skills.graph.callgraph.find_definition", return_value=[func_def]), \
-             patch("claudit.skills.graph.callgraph.get_function_body", return_value=func_body):
-            calls = _callees_of("foo", "/proj", "c", {"foo", "bar"})
-        assert "bar" in calls
+        calls = _extract_calls_from_source(source, "c", {"bar", "baz", "qux"})
+        assert calls == ["baz"]
 
-    def test_no_definition_returns_empty(self):
-        with patch("claudit.skills.graph.callgraph.find_definition", return_value=[]):
-            assert _callees_of("foo", "/proj", "c", {"foo"}) == []
+    def test_python_ignores_comments_and_docstrings(self):
+        source = (
+            "def foo():\n"
+            "    \"\"\"Calls bar() eventually.\"\"\"\n"
+            "    # baz()\n"
+            "    qux('bar()')\n"
+        )
+        calls = _extract_calls_from_source(source, "python", {"bar", "baz", "qux"})
+        assert calls == ["qux"]
 
-    def test_no_body_returns_empty(self):
-        func_def = FunctionDef(name="foo", file="main.c", line=1)
-        with patch("claudit.skills.graph.callgraph.find_definition", return_value=[func_def]), \
-             patch("claudit.skills.graph.callgraph.get_function_body", return_value=None):
-            assert _callees_of("foo", "/proj", "c", {"foo"}) == []
+    def test_python_keeps_calls_in_fstring_fields(self):
+        source = (
+            "def foo():\n"
+            "    log(f\"{bar()} and {{baz()}}\")\n"
+            "    log(rf'{qux(d[\"k\"]):>{width()}}')\n"
+            "    log(\"{nope()}\")\n"
+        )
+        known = {"bar", "baz", "qux", "width", "nope", "log"}
+        calls = _extract_calls_from_source(source, "python", known)
+        assert calls == ["bar", "log", "qux", "width"]
+
+    def test_call_with_space_before_paren(self):
+        source = "void foo() {\n    bar (x);\n}"
+        assert _extract_calls_from_source(source, "c", {"bar"}) == ["bar"]
+
+    def test_callee_names_are_interned(self):
+        source = "void foo() {\n    " + "".join(["b", "ar"]) + "();\n}"
+        (name,) = _extract_calls_from_source(source, "c", {"bar"})
+        assert name is sys.intern("bar")
+
+    def test_unknown_language_returns_empty(self):
+        assert _extract_calls_from_source("foo()", "rust", {"foo"}) == []
 
 
 # ---------------------------------------------------------------------------
@@ -95,49 +135,148 @@ class TestBuildCallGraph:
             source="void foo() {\n    bar();\n}",
         )
         with patch("claudit.skills.graph.callgraph.list_symbols", return_value=["foo", "bar"]), \
-             patch("claudit.skills.graph.callgraph.find_definition", return_value=[func_def]), \
-             patch("claudit.skills.graph.callgraph.get_function_body", return_value=func_body), \
+             patch("claudit.skills.graph.callgraph.find_all_definitions", return_value={"foo": func_def}), \
+             patch("claudit.skills.graph.callgraph.get_function_bodies", return_value={"foo": func_body}), \
              patch("claudit.skills.graph.callgraph._resolve_c_function_pointers", return_value={}):
             graph = build_call_graph("/proj", "c")
         assert "foo" in graph
         assert "bar" in graph["foo"]
 
+    def test_reads_bodies_once_per_file(self, tmp_path):
+        (tmp_path / "main.c").write_text(
+            "void foo() {\n    bar();\n}\nvoid bar() {\n    baz();\n}\nvoid baz() {}\n"
+        )
+        defs = {
+            "foo": FunctionDef(name="foo", file="main.c", line=1),
+            "bar": FunctionDef(name="bar", file="main.c", line=4),
+            "baz": FunctionDef(name="baz", file="main.c", line=7),
+        }
+        tags = [
+            {"_type": "tag", "name": "foo", "line": 1, "kind": "function", "end": 3},
+            {"_type": "tag", "name": "bar", "line": 4, "kind": "function", "end": 6},
+            {"_type": "tag", "name": "baz", "line": 7, "kind": "function", "end": 7},
+        ]
+        with patch("claudit.skills.graph.callgraph.list_symbols", return_value=["foo", "bar", "baz"]), \
+             patch("claudit.skills.graph.callgraph.find_all_definitions", return_value=defs), \
+             patch("claudit.skills.index.indexer._run_ctags",
+                   side_effect=lambda paths: {paths[0]: tags}) as mock_tags, \
+             patch("claudit.skills.graph.callgraph._resolve_c_function_pointers", return_value={}):
+            graph = build_call_graph(str(tmp_path), "c")
+        assert "bar" in graph["foo"]
+        assert "baz" in graph["bar"]
+        assert "baz" not in graph["foo"]
+        mock_tags.assert_called_once()
+
+    def test_parallel_matches_serial(self, tmp_path):
+        (tmp_path / "a.c").write_text("void foo() {\n    bar();\n}\n")
+        (tmp_path / "b.c").write_text("void bar() {\n    baz();\n}\n")
+        defs = {
+            "foo": FunctionDef(name="foo", file="a.c", line=1),
+            "bar": FunctionDef(name="bar", file="b.c", line=1),
+        }
+
+        def fake_ctags(filepaths):
+            return {
+                path: [{"_type": "tag", "name": "foo" if path.endswith("a.c") else "bar",
+                        "line": 1, "kind": "function", "end": 3}]
+                for path in filepaths
+            }
+
+        with patch("claudit.skills.graph.callgraph.list_symbols", return_value=["foo", "bar", "baz"]), \
+             patch("claudit.skills.graph.callgraph.find_all_definitions", return_value=defs), \
+             patch("claudit.skills.index.indexer._run_ctags", side_effect=fake_ctags), \
+             patch("claudit.skills.graph.callgraph._resolve_c_function_pointers", return_value={}):
+            serial = build_call_graph(str(tmp_path), "c")
+            # Threads stand in for processes so the ctags mock stays visible
+            with patch("claudit.skills.graph.callgraph.ProcessPoolExecutor", ThreadPoolExecutor):
+                parallel = build_call_graph(str(tmp_path), "c", jobs=2)
+        assert parallel == serial
+        assert list(parallel) == ["foo", "bar"]
+
     def test_overrides_merged(self):
         with patch("claudit.skills.graph.callgraph.list_symbols", return_value=["foo", "bar"]), \
-             patch("claudit.skills.graph.callgraph.find_definition", return_value=[]), \
-             patch("claudit.skills.graph.callgraph.get_function_body", return_value=None), \
+             patch("claudit.skills.graph.callgraph.find_all_definitions", return_value={}), \
+             patch("claudit.skills.graph.callgraph.get_function_bodies", return_value={}), \
              patch("claudit.skills.graph.callgraph._resolve_c_function_pointers", return_value={}):
             graph = build_call_graph("/proj", "c", overrides={"foo": ["bar", "baz"]})
         assert sorted(graph["foo"]) == ["bar", "baz"]
 
+    def test_fp_edges_and_overrides_merged_sorted(self):
+        fp_edges = {"foo": ["zeta", "bar"], "init": ["handler"]}
+        with patch("claudit.skills.graph.callgraph.list_symbols", return_value=["foo", "bar"]), \
+             patch("claudit.skills.graph.callgraph.find_all_definitions", return_value={}), \
+             patch("claudit.skills.graph.callgraph.get_function_bodies", return_value={}), \
+             patch("claudit.skills.graph.callgraph._resolve_c_function_pointers", return_value=fp_edges):
+            graph = build_call_graph("/proj", "c", overrides={"foo": ["bar", "alpha"]})
+        assert graph["foo"] == ["alpha", "bar", "zeta"]
+        assert graph["init"] == ["handler"]
+
     def test_python_skips_function_pointers(self):
         with patch("claudit.skills.graph.callgraph.list_symbols", return_value=["foo"]), \
-             patch("claudit.skills.graph.callgraph.find_definition", return_value=[]), \
-             patch("claudit.skills.graph.callgraph.get_function_body", return_value=None), \
+             patch("claudit.skills.graph.callgraph.find_all_definitions", return_value={}), \
+             patch("claudit.skills.graph.callgraph.get_function_bodies", return_value={}), \
              patch("claudit.skills.graph.callgraph._resolve_c_function_pointers") as mock_fp:
             build_call_graph("/proj", "python")
         mock_fp.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
-# _find_enclosing_function / _resolve_c_function_pointers
+# reverse_call_graph — pure function
+# ---------------------------------------------------------------------------
+class TestReverseCallGraph:
+    def test_inverts_edges_with_sorted_callers(self):
+        graph = {"z": ["helper"], "a": ["helper", "log"], "m": ["log"]}
+        assert reverse_call_graph(graph) == {
+            "helper": ["a", "z"],
+            "log": ["a", "m"],
+        }
+
+    def test_empty_graph(self):
+        assert reverse_call_graph({}) == {}
+
+
+# ---------------------------------------------------------------------------
+# _file_definitions / _enclosing_function / _resolve_c_function_pointers
 # ---------------------------------------------------------------------------
-class TestFindEnclosingFunction:
-    def test_finds_nearest_above(self, tmp_path):
-        global_output = "init_module 5 init.c void init_module() {\nhelper 20 init.c void helper() {"
+class TestFileDefinitions:
+    def test_sorted_by_line(self, tmp_path):
+        global_output = "helper 20 init.c void helper() {\ninit_module 5 init.c void init_module() {"
         filepath = tmp_path / "init.c"
         filepath.write_text("")
         with patch("shutil.which", return_value="/usr/bin/global"), \
              patch("subprocess.run", return_value=MagicMock(stdout=global_output)):
-            assert _find_enclosing_function(filepath, 10, str(tmp_path)) == "init_module"
+            defs = _file_definitions(filepath, str(tmp_path))
+        assert defs == [(5, "init_module"), (20, "helper")]
 
-    def test_no_global_returns_none(self, tmp_path):
+    def test_no_global_returns_empty(self, tmp_path):
         with patch("shutil.which", return_value=None):
-            assert _find_enclosing_function(tmp_path / "f.c", 10, str(tmp_path)) is None
+            assert _file_definitions(tmp_path / "f.c", str(tmp_path)) == []
 
-    def test_outside_project_returns_none(self, tmp_path):
+    def test_outside_project_returns_empty(self, tmp_path):
         with patch("shutil.which", return_value="/usr/bin/global"):
-            assert _find_enclosing_function(Path("/other/file.c"), 10, str(tmp_path)) is None
+            assert _file_definitions(Path("/other/file.c"), str(tmp_path)) == []
+
+
+class TestEnclosingFunction:
+    def test_finds_nearest_above(self):
+        defs = [(5, "init_module"), (20, "helper")]
+        assert _enclosing_function(defs, 10) == "init_module"
+        assert _enclosing_function(defs, 20) == "helper"
+        assert _enclosing_function(defs, 99) == "helper"
+
+    def test_before_first_definition(self):
+        assert _enclosing_function([(5, "init_module")], 3) is None
+
+
+def _rg_match(path, line_number, text):
+    return json.dumps({
+        "type": "match",
+        "data": {
+            "path": {"text": path},
+            "lines": {"text": text},
+            "line_number": line_number,
+        },
+    })
 
 
 class TestResolveCFunctionPointers:
@@ -146,10 +285,22 @@ class TestResolveCFunctionPointers:
             assert _resolve_c_function_pointers("/proj", {"foo"}) == {}
 
     def test_parses_rg_output(self, tmp_path):
-        rg_output = "init.c:10: .handler = my_func\n"
-        with patch("shutil.which", return_value="/usr/bin/rg"), \
-             patch("subprocess.run", return_value=MagicMock(stdout=rg_output)), \
-             patch("claudit.skills.graph.callgraph._find_enclosing_function", return_value="init_module"):
-            result = _resolve_c_function_pointers(str(tmp_path), {"my_func"})
-        assert "init_module" in result
-        assert "my_func" in result["init_module"]
+        rg_output = "\n".join([
+            json.dumps({"type": "begin", "data": {"path": {"text": "init.c"}}}),
+            _rg_match("init.c", 10, "    .handler = my_func,\n"),
+            _rg_match("init.c", 25, "    ops->cb = other_func;\n"),
+            _rg_match("init.c", 26, "    s.count = total;\n"),
+        ])
+        global_output = "init_module 5 init.c void init_module() {\nsetup 20 init.c void setup() {"
+
+        rg_proc = MagicMock()
+        rg_proc.__enter__.return_value.stdout = iter(rg_output.encode().splitlines(keepends=True))
+
+        with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}"), \
+             patch("subprocess.Popen", return_value=rg_proc) as mock_popen, \
+             patch("subprocess.run", return_value=MagicMock(stdout=global_output)) as mock_run:
+            result = _resolve_c_function_pointers(str(tmp_path), {"my_func", "other_func"})
+        assert result == {"init_module": ["my_func"], "setup": ["other_func"]}
+        assert "--json" in mock_popen.call_args[0][0]
+        # one global -f call for the single file
+        assert mock_run.call_count == 1
@@ -104,6 +104,14 @@ class TestCalleesAndCallers:
         assert result["callers"] == ["a_func", "m_func", "z_func"]
         assert result["count"] == 3
 
+    def test_callers_uses_cached_reverse_index(self, tmp_path):
+        with patch("claudit.skills.graph.load_reverse_call_graph",
+                   return_value={"target": ["a_func"]}), \
+             patch("claudit.skills.graph._require_graph") as require:
+            result = callers(str(tmp_path), "target")
+        assert result["callers"] == ["a_func"]
+        require.assert_not_called()
+
     def test_callees_empty_graph(self, tmp_path):
         with patch("claudit.skills.graph._require_graph", return_value={}):
             result = callees(str(tmp_path), "anything")
@@ -185,6 +185,48 @@ class TestAnalyzeDependencies:
         assert "main" in result.dependency_map
         assert result.dependency_map["main"] == ["helper", "init"]
 
+    def test_repeated_callees_recorded_once(self):
+        graph = {
+            "main": ["helper", "init", "helper"],
+            "helper": [],
+            "init": [],
+        }
+        result = analyze_dependencies(
+            "/fake/project",
+            extracted_function_names={"main"},
+            call_graph=graph,
+            stub_depth=1,
+        )
+        assert result.dependency_map["main"] == ["helper", "init"]
+        assert result.stub_functions == {"helper", "init"}
+
+    def test_max_stubs_stops_walk(self):
+        graph = {
+            "main": ["a", "b", "c"],
+            "a": ["d"],
+            "b": [],
+            "c": [],
+            "d": [],
+        }
+        result = analyze_dependencies(
+            "/fake/project",
+            extracted_function_names={"main"},
+            call_graph=graph,
+            stub_depth=2,
+            max_stubs=2,
+        )
+        assert result.stub_functions == {"a", "b"}
+        assert "a" not in result.dependency_map
+
+    def test_max_stubs_zero(self):
+        result = analyze_dependencies(
+            "/fake/project",
+            extracted_function_names={"main"},
+            call_graph={"main": ["a"], "a": []},
+            max_stubs=0,
+        )
+        assert result.stub_functions == set()
+
     def test_unknown_callee_is_stdlib(self):
         """Callees not in the call graph keys are treated as likely stdlib."""
         graph = {
@@ -270,40 +312,48 @@ class TestAnalyzeDependencies:
 
 
 # ---------------------------------------------------------------------------
-# filter_stub_functions — requires mocked index.lookup
+# filter_stub_functions — mocks the single `global -d` subprocess call
 # ---------------------------------------------------------------------------
 class TestFilterStubFunctions:
-    """Test filtering of stubs against index lookups."""
+    """Test filtering of stubs against the project's definitions."""
 
-    def test_keeps_found_functions(self):
-        from unittest.mock import patch
+    GLOBAL_OUTPUT = (
+        b"helper\tutil.c\t5\n"
+        b"process\tmain.c\t3\n"
+    )
+
+    def test_keeps_found_functions(self, c_project):
+        from unittest.mock import patch, MagicMock
         from claudit.skills.harness.dependency_analyzer import filter_stub_functions
 
-        with patch(
-            "claudit.skills.index.lookup",
-            return_value={"definitions": [{"name": "helper", "file": "util.c", "line": 5}]},
-        ):
-            result = filter_stub_functions({"helper"}, "/fake")
-        assert "helper" in result
+        with patch("shutil.which", return_value="/usr/bin/global"), \
+             patch("subprocess.run", return_value=MagicMock(stdout=self.GLOBAL_OUTPUT)) as mock_run:
+            result = filter_stub_functions({"helper", "process", "external_fn"}, str(c_project))
+        assert result == {"helper", "process"}
+        # One query for the whole batch
+        mock_run.assert_called_once()
 
-    def test_removes_not_found_functions(self):
-        from unittest.mock import patch
+    def test_removes_not_found_functions(self, c_project):
+        from unittest.mock import patch, MagicMock
         from claudit.skills.harness.dependency_analyzer import filter_stub_functions
 
-        with patch(
-            "claudit.skills.index.lookup",
-            return_value={"definitions": []},
-        ):
-            result = filter_stub_functions({"external_fn"}, "/fake")
+        with patch("shutil.which", return_value="/usr/bin/global"), \
+             patch("subprocess.run", return_value=MagicMock(stdout=b"")):
+            result = filter_stub_functions({"external_fn"}, str(c_project))
         assert "external_fn" not in result
 
-    def test_removes_functions_on_lookup_error(self):
+    def test_removes_functions_when_global_missing(self, c_project):
         from unittest.mock import patch
         from claudit.skills.harness.dependency_analyzer import filter_stub_functions
 
-        with patch(
-            "claudit.skills.index.lookup",
-            side_effect=Exception("global not found"),
-        ):
-            result = filter_stub_functions({"broken_fn"}, "/fake")
+        with patch("shutil.which", return_value=None):
+            result = filter_stub_functions({"broken_fn"}, str(c_project))
         assert "broken_fn" not in result
+
+    def test_no_index_keeps_nothing(self, tmp_path):
+        from unittest.mock import patch
+        from claudit.skills.harness.dependency_analyzer import filter_stub_functions
+
+        with patch("subprocess.run") as mock_run:
+            assert filter_stub_functions({"helper"}, str(tmp_path)) == set()
+        mock_run.assert_not_called()
@@ -5,6 +5,7 @@ extract_target_functions and friends delegate to index.get_body and
 signature_extractor which themselves call subprocess.
 """
 
+import time
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
@@ -112,6 +113,36 @@ class TestExtractTargetFunctions:
             with pytest.raises(ValueError, match="not found"):
                 extract_target_functions("/project", ["nonexistent"], "c")
 
+    def test_many_functions_keep_input_order(self):
+        names = [f"f{i}" for i in range(12)]
+
+        def mock_get_body(project_dir, func_name, language=None, auto_index=True):
+            # Earlier names finish last
+            time.sleep(0.001 * (12 - int(func_name[1:])))
+            return _make_get_body_return(func_name, "a.c", "void x() {}", 1, 1)
+
+        with patch("claudit.skills.harness.extractor.get_body", side_effect=mock_get_body), \
+             patch("claudit.skills.harness.extractor.extract_signature", return_value=None):
+            result = extract_target_functions("/project", names, "c")
+
+        assert [f.name for f in result] == names
+
+    def test_missing_function_after_first_raises(self):
+        body = _make_get_body_return("foo", "main.c", "void foo() {}", 1, 1)
+
+        def mock_get_body(project_dir, func_name, language=None, auto_index=True):
+            return body if func_name == "foo" else None
+
+        with patch("claudit.skills.harness.extractor.get_body", side_effect=mock_get_body), \
+             patch("claudit.skills.harness.extractor.extract_signature", return_value=None):
+            with pytest.raises(ValueError, match="'bar' not found"):
+                extract_target_functions("/project", ["foo", "bar", "foo"], "c")
+
+    def test_no_functions(self):
+        with patch("claudit.skills.harness.extractor.get_body") as mock_get_body:
+            assert extract_target_functions("/project", [], "c") == []
+        mock_get_body.assert_not_called()
+
     def test_fallback_signature_when_ctags_fails(self):
         """When extract_signature returns None, a fallback is used."""
         body = _make_get_body_return(
@@ -138,24 +169,40 @@ class TestExtractFunctionsFromFile:
             _make_ctags_tag("bar", 2, "function", end=2),
         ]
 
-        body_foo = _make_get_body_return("foo", "test.c", "void foo() {}", 1, 1)
-        body_bar = _make_get_body_return("bar", "test.c", "int bar(int x) { return x; }", 2, 2)
-
-        def mock_get_body(project_dir, func_name, language=None, auto_index=True):
-            return {"foo": body_foo, "bar": body_bar}[func_name]
-
         sig = MagicMock()
         sig.full_signature = "sig"
 
+        # Bodies are sliced from the file using the same tags; Global is
+        # never consulted because ctags already located each definition.
         with patch("claudit.skills.harness.extractor.get_ctags_tags", return_value=tags), \
-             patch("claudit.skills.harness.extractor.get_body", side_effect=mock_get_body), \
+             patch("claudit.skills.index.indexer.get_ctags_tags", return_value=tags), \
+             patch("claudit.skills.index.indexer.subprocess.run") as mock_run, \
              patch("claudit.skills.harness.extractor.extract_signature", return_value=sig):
             result = extract_functions_from_file(str(tmp_path), "test.c", "c")
 
-        assert len(result) == 2
-        names = [f.name for f in result]
-        assert "foo" in names
-        assert "bar" in names
+        mock_run.assert_not_called()
+        assert [(f.name, f.source) for f in result] == [
+            ("foo", "void foo() {}"),
+            ("bar", "int bar(int x) { return x; }"),
+        ]
+        assert result[1].start_line == 2
+        assert result[1].file == "test.c"
+
+    def test_overloads_keep_their_own_bodies(self, tmp_path):
+        """Same-named definitions in one file are each sliced at their own line."""
+        (tmp_path / "A.java").write_text(
+            "class A {\n  void f() {}\n  void f(int x) {}\n}\n"
+        )
+        tags = [
+            _make_ctags_tag("f", 2, "method", end=2),
+            _make_ctags_tag("f", 3, "method", end=3),
+        ]
+        with patch("claudit.skills.harness.extractor.get_ctags_tags", return_value=tags), \
+             patch("claudit.skills.index.indexer.get_ctags_tags", return_value=tags), \
+             patch("claudit.skills.harness.extractor.extract_signature", return_value=None):
+            result = extract_functions_from_file(str(tmp_path), "A.java", "java")
+
+        assert [f.source for f in result] == ["  void f() {}", "  void f(int x) {}"]
 
     def test_file_not_found(self, tmp_path):
         """FileNotFoundError raised for missing file."""
@@ -180,12 +227,11 @@ class TestExtractFunctionsFromFile:
             {"_type": "tag", "name": "x", "line": 1, "kind": "variable"},
             _make_ctags_tag("foo", 2, "function", end=2),
         ]
-        body = _make_get_body_return("foo", "mixed.c", "void foo() {}", 2, 2)
         sig = MagicMock()
         sig.full_signature = "void foo()"
 
         with patch("claudit.skills.harness.extractor.get_ctags_tags", return_value=tags), \
-             patch("claudit.skills.harness.extractor.get_body", return_value=body), \
+             patch("claudit.skills.index.indexer.get_ctags_tags", return_value=tags), \
              patch("claudit.skills.harness.extractor.extract_signature", return_value=sig):
             result = extract_functions_from_file(str(tmp_path), "mixed.c", "c")
 
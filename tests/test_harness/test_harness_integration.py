@@ -127,40 +127,29 @@ class TestExtractFile:
     def test_extracts_file(self, c_project):
         """extract_file extracts all functions from a source file."""
         tags = [
-            {"_type": "tag", "name": "process", "line": 3, "kind": "function"},
-            {"_type": "tag", "name": "main", "line": 7, "kind": "function"},
+            {"_type": "tag", "name": "process", "line": 3, "kind": "function", "end": 5},
+            {"_type": "tag", "name": "main", "line": 7, "kind": "function", "end": 10},
         ]
-        bodies = {
-            "process": {
-                "function": "process",
-                "file": "main.c",
-                "start_line": 3,
-                "end_line": 5,
-                "source": "void process(int x) {\n    helper(x);\n}",
-                "language": "c",
-            },
-            "main": {
-                "function": "main",
-                "file": "main.c",
-                "start_line": 7,
-                "end_line": 10,
-                "source": "int main(int argc, char **argv) {\n    process(argc);\n    return 0;\n}",
-                "language": "c",
-            },
-        }
-
-        def mock_get_body(project_dir, func_name, language=None, auto_index=True):
-            return bodies[func_name]
-
         sig = MagicMock()
         sig.full_signature = "sig"
 
         with patch("claudit.skills.harness.extractor.get_ctags_tags", return_value=tags), \
-             patch("claudit.skills.harness.extractor.get_body", side_effect=mock_get_body), \
+             patch("claudit.skills.index.indexer.get_ctags_tags", return_value=tags), \
              patch("claudit.skills.harness.extractor.extract_signature", return_value=sig):
             result = extract_file(str(c_project), "main.c")
 
         assert len(result) == 2
+        assert result[0].source == "void process(int x) {\n    helper(x);\n}"
+        assert result[1].end_line == 10
+
+    def test_file_is_project_relative(self, c_project):
+        tags = [{"_type": "tag", "name": "process", "line": 3, "kind": "function", "end": 5}]
+        with patch("claudit.skills.harness.extractor.get_ctags_tags", return_value=tags), \
+             patch("claudit.skills.index.indexer.get_ctags_tags", return_value=tags), \
+             patch("claudit.skills.harness.extractor.extract_signature", return_value=None):
+            by_relative = extract_file(str(c_project), "./main.c")
+            by_absolute = extract_file(str(c_project), str(c_project / "main.c"))
+        assert by_relative[0].file == by_absolute[0].file == "main.c"
 
     def test_missing_file_raises(self, c_project):
         with pytest.raises(FileNotFoundError):
@@ -178,8 +167,7 @@ class TestAnalyzeDependencies:
             "helper": [],
         }
 
-        with patch("claudit.skills.index.indexer.ensure_index"), \
-             patch("claudit.skills.graph.cache.load_call_graph", return_value=graph):
+        with patch("claudit.skills.graph.load_call_graph", return_value=graph):
             result = analyze_dependencies(str(c_project), ["process"])
 
         assert isinstance(result, DependencySet)
@@ -190,14 +178,23 @@ class TestAnalyzeDependencies:
         """When no cached graph, analyze_dependencies builds one."""
         graph = {"process": ["helper"], "helper": []}
 
-        with patch("claudit.skills.index.indexer.ensure_index"), \
-             patch("claudit.skills.graph.cache.load_call_graph", side_effect=[None, graph]), \
-             patch("claudit.skills.graph.build") as mock_build:
+        with patch("claudit.skills.graph.ensure_index"), \
+             patch("claudit.skills.graph.load_call_graph", return_value=None), \
+             patch("claudit.skills.graph.build_call_graph", return_value=graph) as mock_build, \
+             patch("claudit.skills.graph.save_call_graph") as mock_save:
             result = analyze_dependencies(str(c_project), ["process"])
 
         mock_build.assert_called_once()
+        # Built graph is used directly, not re-read from the cache
+        mock_save.assert_called_once_with(str(c_project), graph)
         assert "helper" in result.stub_functions
 
+    def test_empty_function_list_skips_graph(self, c_project):
+        with patch("claudit.skills.graph.load_call_graph") as mock_load:
+            result = analyze_dependencies(str(c_project), [])
+        mock_load.assert_not_called()
+        assert result == DependencySet()
+
 
 # ---------------------------------------------------------------------------
 # get_function_signature
@@ -215,7 +212,7 @@ class TestGetFunctionSignature:
             full_signature="void helper(int x)",
         )
 
-        with patch("claudit.skills.index.lookup", return_value=lookup_result), \
+        with patch("claudit.skills.harness.lookup", return_value=lookup_result), \
              patch("claudit.skills.harness.extract_signature", return_value=sig):
             result = get_function_signature(str(c_project), "helper")
 
@@ -225,7 +222,7 @@ class TestGetFunctionSignature:
 
     def test_returns_none_for_unknown(self, c_project):
         """Returns None when function not found in index."""
-        with patch("claudit.skills.index.lookup", return_value={"definitions": []}):
+        with patch("claudit.skills.harness.lookup", return_value={"definitions": []}):
             result = get_function_signature(str(c_project), "unknown")
         assert result is None
 
@@ -237,19 +234,19 @@ class TestGetFunctionCallees:
     def test_returns_callees(self, tmp_path):
         """get_function_callees returns callees from cached graph."""
         graph = {"process": ["helper", "init"], "helper": ["util"]}
-        with patch("claudit.skills.graph.cache.load_call_graph", return_value=graph):
+        with patch("claudit.skills.harness.load_call_graph", return_value=graph):
             result = get_function_callees(str(tmp_path), "process")
         assert result == ["helper", "init"]
 
     def test_returns_empty_for_unknown(self, tmp_path):
         """Unknown function returns empty list."""
         graph = {"process": ["helper"]}
-        with patch("claudit.skills.graph.cache.load_call_graph", return_value=graph):
+        with patch("claudit.skills.harness.load_call_graph", return_value=graph):
             result = get_function_callees(str(tmp_path), "unknown")
         assert result == []
 
     def test_returns_empty_when_no_graph(self, tmp_path):
         """When no cached graph exists, returns empty list."""
-        with patch("claudit.skills.graph.cache.load_call_graph", return_value=None):
+        with patch("claudit.skills.harness.load_call_graph", return_value=None):
             result = get_function_callees(str(tmp_path), "process")
         assert result == []
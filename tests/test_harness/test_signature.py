@@ -40,6 +40,13 @@ class TestCParameterParsing:
         assert params[0].name == "ptr"
         assert params[0].type == "void"
 
+    def test_function_pointer_param(self):
+        params = _parse_c_parameters("(int (*cb)(int, int), size_t n)")
+        assert len(params) == 2
+        assert params[0] == Parameter(name="cb", type="int (*)(int, int)")
+        assert params[1].name == "n"
+        assert params[1].type == "size_t"
+
 
 class TestJavaParameterParsing:
     """Test Java parameter parsing."""
@@ -62,6 +69,14 @@ class TestJavaParameterParsing:
         assert params[1].name == "age"
         assert params[1].type == "int"
 
+    def test_generic_params(self):
+        params = _parse_java_parameters("(Map<String, Integer> counts, int[] xs)")
+        assert len(params) == 2
+        assert params[0].name == "counts"
+        assert params[0].type == "Map<String, Integer>"
+        assert params[1].name == "xs"
+        assert params[1].type == "int[]"
+
 
 class TestPythonParameterParsing:
     """Test Python parameter parsing."""
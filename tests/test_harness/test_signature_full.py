@@ -106,6 +106,23 @@ class TestExtractSignature:
         assert sig is not None
         assert sig.full_signature == "init()"
 
+    def test_tags_indexed_once_per_file(self, tmp_path):
+        src = tmp_path / "main.c"
+        src.write_text("int a(void) {}\nint b(void) {}\n")
+        tags = [
+            {"_type": "tag", "name": "a", "line": 1, "kind": "function", "signature": "()"},
+            {"_type": "tag", "name": "b", "line": 2, "kind": "function", "signature": "()"},
+            {"_type": "tag", "name": "b", "line": 9, "kind": "function", "signature": "(int x)"},
+        ]
+        with patch(
+            "claudit.skills.harness.signature_extractor.get_ctags_tags", return_value=tags
+        ) as mock_tags:
+            assert extract_signature(str(src), "a", "c").name == "a"
+            sig_b = extract_signature(str(src), "b", "c")
+        mock_tags.assert_called_once()
+        # First definition wins, as with the old linear scan
+        assert sig_b.parameters == []
+
     def test_returns_none_when_not_found(self):
         tags = [
             {"_type": "tag", "name": "other", "line": 1, "kind": "function"},
@@ -330,3 +347,8 @@ class TestExtractCReturnType:
         f = tmp_path / "test.c"
         f.write_text("int other_func(void) {}\n")
         assert _extract_c_return_type(str(f), 1, "missing") == "void"
+
+    def test_storage_classes_stripped_as_words(self, tmp_path):
+        f = tmp_path / "test.c"
+        f.write_text("static inline staticbuf_t *get(void) {}\n")
+        assert _extract_c_return_type(str(f), 1, "get") == "staticbuf_t *"
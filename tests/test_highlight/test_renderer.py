@@ -1,5 +1,6 @@
 """Tests for the highlight renderer — uses real Pygments highlighting."""
 
+import re
 from unittest.mock import patch
 
 from claudit.skills.index.indexer import FunctionDef, FunctionBody
@@ -30,6 +31,12 @@ class TestHighlightSource:
         src = "some random text"
         assert _highlight_source(src, "brainfuck_nonexistent_xyz", "monokai") == src
 
+    def test_repeat_calls_give_same_html(self):
+        # Lexer and formatter are shared between calls
+        first = _highlight_source("int x = 42;", "c", "monokai")
+        _highlight_source("def foo(): pass", "python", "monokai")
+        assert _highlight_source("int x = 42;", "c", "monokai") == first
+
 
 # ---------------------------------------------------------------------------
 # _build_hop_note — pure function
@@ -77,6 +84,20 @@ class TestFindCallSite:
                             source="void foo() {\n    x = 1;\n}")
         assert _find_call_site(body, "helper") is None
 
+    def test_skips_longer_identifier_and_non_call(self):
+        body = FunctionBody(file="f.c", start_line=1, end_line=4,
+                            source="void foo() {\n    my_helper(1); helper = 2;\n    helper (3);\n}")
+        site = _find_call_site(body, "helper")
+        assert site["line"] == 3
+        assert site["col_start"] == 5
+        assert site["col_end"] == 10
+        assert site["snippet"] == "helper (3);"
+
+    def test_paren_on_next_line_is_not_a_call_site(self):
+        body = FunctionBody(file="f.c", start_line=1, end_line=3,
+                            source="x = helper\n(1);")
+        assert _find_call_site(body, "helper") is None
+
 
 # ---------------------------------------------------------------------------
 # _definition_span — pure function
@@ -142,22 +163,30 @@ class TestHighlightPath:
         def mock_find_def(name, proj):
             return [FunctionDef(name=name, file=f"{name}.c", line=1)]
 
-        def mock_get_body(func_def, proj, lang):
-            idx = path_list.index(func_def.name) if func_def.name in path_list else -1
-            next_name = path_list[idx + 1] if 0 <= idx < len(path_list) - 1 else "next"
-            return FunctionBody(
-                file=func_def.file, start_line=1, end_line=3,
-                source=f"void {func_def.name}() {{\n    {next_name}();\n}}",
-            )
+        def mock_get_bodies(func_defs, proj):
+            bodies = {}
+            for d in func_defs:
+                next_name = path_list[path_list.index(d.name) + 1]
+                bodies[d.name] = FunctionBody(
+                    file=d.file, start_line=1, end_line=3,
+                    source=f"void {d.name}() {{\n    {next_name}();\n}}",
+                )
+            return bodies
 
         with patch("claudit.skills.highlight.renderer.find_definition", side_effect=mock_find_def), \
-             patch("claudit.skills.highlight.renderer.get_function_body", side_effect=mock_get_body), \
+             patch("claudit.skills.highlight.renderer.get_function_bodies", side_effect=mock_get_bodies) as mock_bodies, \
              patch("claudit.lang.detect_language", return_value="c"):
             result = highlight_path(str(tmp_path), path_list)
 
+        # Bodies for every caller hop come from one batched call
+        mock_bodies.assert_called_once()
+        assert [d.name for d in mock_bodies.call_args[0][0]] == ["main", "helper"]
+
         assert "metadata" in result
         assert result["metadata"]["tool"] == "claudit"
-        assert "timestamp" in result["metadata"]
+        assert re.fullmatch(
+            r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z", result["metadata"]["timestamp"]
+        )
         assert "results" in result
         # 5 results: def(main), call(main->helper), def(helper), call(helper->target), def(target)
         assert len(result["results"]) == 5
@@ -8,6 +8,8 @@ from unittest.mock import patch
 
 from claudit.skills.index.indexer import FunctionDef, FunctionBody
 from claudit.skills.highlight.renderer import (
+    HOP_COLORS,
+    HOP_COLORS_RGBA,
     _hex_to_rgba,
     _definition_span,
     _find_call_site,
@@ -41,6 +43,9 @@ class TestHexToRgba:
         result = _hex_to_rgba("#FFF", alpha=0.3)
         assert result == "rgba(0, 0, 0, 0.3)"
 
+    def test_hop_colors_precomputed(self):
+        assert HOP_COLORS_RGBA == [_hex_to_rgba(c) for c in HOP_COLORS]
+
 
 # ---------------------------------------------------------------------------
 # _definition_span — reading from real files
@@ -119,9 +124,12 @@ class TestHighlightSourceEdgeCases:
         assert "<span" in html
 
     def test_empty_source(self):
-        html = _highlight_source("", "c", "monokai")
-        # Empty source should produce empty or minimal HTML
-        assert isinstance(html, str)
+        assert _highlight_source("", "c", "monokai") == ""
+
+    def test_whitespace_source_skips_pygments(self):
+        with patch("claudit.skills.highlight.renderer._pygments_highlight") as mock_hl:
+            assert _highlight_source("  \n", "c", "monokai") == "  \n"
+        mock_hl.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -149,15 +157,18 @@ class TestHighlightPathNoCallSite:
         def mock_find_def(name, proj):
             return [FunctionDef(name=name, file=f"{name}.c", line=1)]
 
-        def mock_get_body(func_def, proj, lang):
+        def mock_get_bodies(func_defs, proj):
             # main's body does NOT contain "target("
-            return FunctionBody(
-                file=func_def.file, start_line=1, end_line=3,
-                source=f"void {func_def.name}() {{\n    x = 1;\n}}",
-            )
+            return {
+                d.name: FunctionBody(
+                    file=d.file, start_line=1, end_line=3,
+                    source=f"void {d.name}() {{\n    x = 1;\n}}",
+                )
+                for d in func_defs
+            }
 
         with patch("claudit.skills.highlight.renderer.find_definition", side_effect=mock_find_def), \
-             patch("claudit.skills.highlight.renderer.get_function_body", side_effect=mock_get_body), \
+             patch("claudit.skills.highlight.renderer.get_function_bodies", side_effect=mock_get_bodies), \
              patch("claudit.lang.detect_language", return_value="c"):
             result = highlight_path(str(tmp_path), path_list)
 
@@ -174,7 +185,7 @@ class TestHighlightPathNoCallSite:
             return [FunctionDef(name=name, file=f"{name}.c", line=1)]
 
         with patch("claudit.skills.highlight.renderer.find_definition", side_effect=mock_find_def), \
-             patch("claudit.skills.highlight.renderer.get_function_body", return_value=None), \
+             patch("claudit.skills.highlight.renderer.get_function_bodies", return_value={}), \
              patch("claudit.lang.detect_language", return_value="c"):
             result = highlight_path(str(tmp_path), path_list)
 
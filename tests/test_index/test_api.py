@@ -31,7 +31,7 @@ class TestCreate:
 class TestListSymbols:
     def test_structured_result(self, tmp_path):
         (tmp_path / "GTAGS").write_text("fake")
-        mock_result = MagicMock(stdout="foo\nbar\n", returncode=0)
+        mock_result = MagicMock(stdout=b"foo\nbar\n", returncode=0)
         with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
              patch("subprocess.run", return_value=mock_result):
             result = list_symbols(str(tmp_path))
@@ -4,6 +4,7 @@ Tests that hit subprocess (global, gtags, ctags) mock subprocess.run.
 Everything else is tested against real files.
 """
 
+import os
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -13,14 +14,21 @@ from claudit.skills.index.indexer import (
     FunctionDef,
     FunctionBody,
     ensure_index,
+    find_all_definitions,
     find_definition,
+    find_definitions,
     find_references,
     get_ctags_tags,
     get_function_body,
+    get_function_bodies,
     list_symbols,
     gtags_mtime,
+    iter_function_tags,
+    read_source_lines,
+    resolve_project,
     _find_project_root,
     _ctags_function_bounds,
+    which,
 )
 
 
@@ -60,6 +68,15 @@ class TestFindProjectRoot:
             _find_project_root(str(tmp_path / "nonexistent"))
 
 
+class TestResolveProject:
+    def test_matches_path_resolve(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "proj").mkdir()
+        assert resolve_project("proj") == (tmp_path / "proj").resolve()
+        proj = str(tmp_path / "proj")
+        assert resolve_project(proj) is resolve_project(proj)
+
+
 class TestGtagsMtime:
     def test_returns_mtime_when_exists(self, tmp_path):
         (tmp_path / "GTAGS").write_text("data")
@@ -88,6 +105,92 @@ class TestFindDefinition:
              patch("subprocess.run", return_value=mock_result):
             assert find_definition("nonexistent", str(tmp_path)) == []
 
+    def test_memoized_until_gtags_changes(self, tmp_path):
+        gtags = tmp_path / "GTAGS"
+        gtags.write_text("v1")
+        mock_result = MagicMock(stdout="main.c:10: int foo(void) {", returncode=0)
+        with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
+             patch("subprocess.run", return_value=mock_result) as mock_run:
+            find_definition("foo", str(tmp_path))
+            defs = find_definition("foo", str(tmp_path))
+            assert mock_run.call_count == 1
+            defs.clear()  # callers get their own list
+            assert len(find_definition("foo", str(tmp_path))) == 1
+
+            st = gtags.stat()
+            os.utime(gtags, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            find_definition("foo", str(tmp_path))
+            assert mock_run.call_count == 2
+
+
+class TestFindAllDefinitions:
+    def test_keeps_first_definition_per_name(self, tmp_path):
+        mock_result = MagicMock(
+            stdout=(
+                b"foo\tmain.c\t10\n"
+                b"foo\tutil.c\t20\n"
+                b"bar\tutil.c\t3\n"
+            ),
+            returncode=0,
+        )
+        with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
+             patch("subprocess.run", return_value=mock_result) as mock_run:
+            defs = find_all_definitions(str(tmp_path))
+        mock_run.assert_called_once()
+        assert defs == {
+            "foo": FunctionDef(name="foo", file="main.c", line=10),
+            "bar": FunctionDef(name="bar", file="util.c", line=3),
+        }
+
+    def test_skips_malformed_lines(self, tmp_path):
+        mock_result = MagicMock(stdout=b"garbage\nfoo\tmain.c\tx\nfoo\t10\n", returncode=0)
+        with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
+             patch("subprocess.run", return_value=mock_result):
+            assert find_all_definitions(str(tmp_path)) == {}
+
+    def test_path_with_spaces(self, tmp_path):
+        mock_result = MagicMock(stdout=b"foo\tmy src/main file.c\t7\n", returncode=0)
+        with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
+             patch("subprocess.run", return_value=mock_result):
+            defs = find_all_definitions(str(tmp_path))
+        assert defs == {"foo": FunctionDef(name="foo", file="my src/main file.c", line=7)}
+
+
+class TestFindDefinitions:
+    def test_one_query_for_all_names(self, tmp_path):
+        mock_result = MagicMock(
+            stdout=(
+                "foo\tmain.c\t10\n"
+                "foo\tutil.c\t20\n"
+                "bar\tutil.c\t3\n"
+            ),
+            returncode=0,
+        )
+        with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
+             patch("subprocess.run", return_value=mock_result) as mock_run:
+            defs = find_definitions(["foo", "bar", "foo", "baz"], str(tmp_path))
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][-1] == "^(foo|bar|baz)$"
+        assert defs == {
+            "foo": [
+                FunctionDef(name="foo", file="main.c", line=10),
+                FunctionDef(name="foo", file="util.c", line=20),
+            ],
+            "bar": [FunctionDef(name="bar", file="util.c", line=3)],
+        }
+
+    def test_path_with_spaces(self, tmp_path):
+        mock_result = MagicMock(stdout="foo\tlib dir/a b.c\t4\n", returncode=0)
+        with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
+             patch("subprocess.run", return_value=mock_result):
+            defs = find_definitions(["foo"], str(tmp_path))
+        assert defs == {"foo": [FunctionDef(name="foo", file="lib dir/a b.c", line=4)]}
+
+    def test_no_names_skips_global(self, tmp_path):
+        with patch("subprocess.run") as mock_run:
+            assert find_definitions([], str(tmp_path)) == {}
+        mock_run.assert_not_called()
+
 
 class TestFindReferences:
     def test_parses_global_output(self, tmp_path):
@@ -105,7 +208,7 @@ class TestFindReferences:
 
 class TestListSymbols:
     def test_parses_output(self, tmp_path):
-        mock_result = MagicMock(stdout="foo\nbar\nbaz\n", returncode=0)
+        mock_result = MagicMock(stdout=b"foo\nbar\nbaz\n", returncode=0)
         with patch("claudit.skills.index.indexer._check_global", return_value="/usr/bin/global"), \
              patch("subprocess.run", return_value=mock_result):
             assert list_symbols(str(tmp_path)) == ["foo", "bar", "baz"]
@@ -116,9 +219,9 @@ class TestCtagsTags:
         src = tmp_path / "test.c"
         src.write_text("void foo() { bar(); }")
         ctags_output = (
-            '{"_type": "tag", "name": "foo", "line": 1, "kind": "function", "end": 3}\n'
-            '{"_type": "ptag", "name": "!_TAG"}\n'
-            '{"_type": "tag", "name": "bar", "line": 2, "kind": "function", "end": 4}\n'
+            b'{"_type": "tag", "name": "foo", "line": 1, "kind": "function", "end": 3}\n'
+            b'{"_type": "ptag", "name": "!_TAG"}\n'
+            b'{"_type": "tag", "name": "bar", "line": 2, "kind": "function", "end": 4}\n'
         )
         mock_result = MagicMock(stdout=ctags_output, returncode=0)
         with patch("claudit.skills.index.indexer._check_ctags", return_value="/usr/bin/ctags"), \
@@ -132,7 +235,7 @@ class TestCtagsTags:
         src = tmp_path / "test.c"
         src.write_text("void foo() {}")
         mock_result = MagicMock(
-            stdout='not json\n{"_type": "tag", "name": "foo", "line": 1, "kind": "function"}\n',
+            stdout=b'not json\n{"_type": "tag", "name": "foo", "line": 1, "kind": "function"}\n',
             returncode=0,
         )
         with patch("claudit.skills.index.indexer._check_ctags", return_value="/usr/bin/ctags"), \
@@ -140,6 +243,36 @@ class TestCtagsTags:
             tags = get_ctags_tags(str(src))
         assert len(tags) == 1
 
+    def test_memoized_until_file_changes(self, tmp_path):
+        src = tmp_path / "test.c"
+        src.write_text("void foo() {}")
+        mock_result = MagicMock(
+            stdout=b'{"_type": "tag", "name": "foo", "line": 1, "kind": "function"}\n',
+            returncode=0,
+        )
+        with patch("claudit.skills.index.indexer._check_ctags", return_value="/usr/bin/ctags"), \
+             patch("subprocess.run", return_value=mock_result) as mock_run:
+            get_ctags_tags(str(src))
+            get_ctags_tags(str(src))
+            assert mock_run.call_count == 1
+
+            st = src.stat()
+            os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            get_ctags_tags(str(src))
+            assert mock_run.call_count == 2
+
+
+class TestIterFunctionTags:
+    def test_keeps_named_function_kinds(self):
+        tags = [
+            {"name": "f", "kind": "function"},
+            {"name": "m", "kind": "method"},
+            {"name": "d", "kind": "def"},
+            {"name": "S", "kind": "struct"},
+            {"kind": "function"},
+        ]
+        assert [t["name"] for t in iter_function_tags(tags)] == ["f", "m", "d"]
+
 
 class TestCtagsFunctionBounds:
     def test_exact_match(self):
@@ -187,6 +320,93 @@ class TestGetFunctionBody:
             assert get_function_body(func, str(tmp_path), "c") is None
 
 
+class TestGetFunctionBodies:
+    def test_groups_by_file(self, tmp_path):
+        (tmp_path / "main.c").write_text("void foo() {\n    bar();\n}\nvoid bar() {}\n")
+        defs = [
+            FunctionDef(name="foo", file="main.c", line=1),
+            FunctionDef(name="bar", file="main.c", line=4),
+        ]
+        ctags_output = (
+            b'{"_type": "tag", "name": "foo", "line": 1, "kind": "function", "end": 3}\n'
+            b'{"_type": "tag", "name": "bar", "line": 4, "kind": "function", "end": 4}\n'
+        )
+        mock_result = MagicMock(stdout=ctags_output, returncode=0)
+        with patch("claudit.skills.index.indexer._check_ctags", return_value="/usr/bin/ctags"), \
+             patch("subprocess.run", return_value=mock_result) as mock_run:
+            bodies = get_function_bodies(defs, str(tmp_path))
+        mock_run.assert_called_once()
+        assert bodies["foo"] == FunctionBody(
+            file="main.c", start_line=1, end_line=3,
+            source="void foo() {\n    bar();\n}",
+        )
+        assert bodies["bar"].source == "void bar() {}"
+
+    def test_skips_missing_files_and_unbounded_functions(self, tmp_path):
+        (tmp_path / "main.c").write_text("void foo() {}\n")
+        defs = [
+            FunctionDef(name="foo", file="main.c", line=1),
+            FunctionDef(name="gone", file="nope.c", line=1),
+        ]
+        mock_result = MagicMock(stdout=b"", returncode=0)
+        with patch("claudit.skills.index.indexer._check_ctags", return_value="/usr/bin/ctags"), \
+             patch("subprocess.run", return_value=mock_result):
+            assert get_function_bodies(defs, str(tmp_path)) == {}
+
+    def test_one_ctags_run_across_files(self, tmp_path):
+        (tmp_path / "a.c").write_text("void foo() {}\n")
+        (tmp_path / "b.c").write_text("void bar() {}\n")
+        a, b = str(tmp_path.resolve() / "a.c"), str(tmp_path.resolve() / "b.c")
+        ctags_output = (
+            f'{{"_type": "tag", "name": "foo", "path": "{a}", "line": 1, "kind": "function", "end": 1}}\n'
+            f'{{"_type": "tag", "name": "bar", "path": "{b}", "line": 1, "kind": "function", "end": 1}}\n'
+        )
+        defs = [
+            FunctionDef(name="foo", file="a.c", line=1),
+            FunctionDef(name="bar", file="b.c", line=1),
+        ]
+        mock_result = MagicMock(stdout=ctags_output.encode(), returncode=0)
+        with patch("claudit.skills.index.indexer._check_ctags", return_value="/usr/bin/ctags"), \
+             patch("subprocess.run", return_value=mock_result) as mock_run:
+            bodies = get_function_bodies(defs, str(tmp_path))
+            # Both files are now memoized individually
+            assert get_ctags_tags(a)[0]["name"] == "foo"
+            assert get_ctags_tags(b)[0]["name"] == "bar"
+        mock_run.assert_called_once()
+        assert bodies["foo"].source == "void foo() {}"
+        assert bodies["bar"].source == "void bar() {}"
+
+
+class TestReadSourceLines:
+    def test_memoized_until_file_changes(self, tmp_path):
+        src = tmp_path / "main.c"
+        src.write_text("int a;\nint b;\n")
+        first = read_source_lines(src)
+        assert first == ("int a;", "int b;")
+        assert read_source_lines(str(src)) is first
+
+        src.write_text("int c;\n")
+        st = src.stat()
+        os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert read_source_lines(src) == ("int c;",)
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert read_source_lines(tmp_path / "nope.c") == ()
+
+    def test_crlf_and_invalid_utf8(self, tmp_path):
+        src = tmp_path / "win.c"
+        src.write_bytes(b"int a;\r\nchar *s = \"\xff\";\r\n")
+        assert read_source_lines(src) == ("int a;", 'char *s = "\ufffd";')
+
+
+class TestWhich:
+    def test_searches_path_once_per_tool(self):
+        with patch("shutil.which", return_value="/usr/bin/rg") as mock_which:
+            assert which("rg") == "/usr/bin/rg"
+            assert which("rg") == "/usr/bin/rg"
+        mock_which.assert_called_once_with("rg")
+
+
 class TestErrorClasses:
     def test_global_not_found(self):
         with patch("shutil.which", return_value=None):
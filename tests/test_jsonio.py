@@ -0,0 +1,39 @@
+"""Tests for the shared JSON helpers — run against both backends."""
+
+import json
+
+import pytest
+
+import claudit.jsonio as jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+class TestJsonio:
+    def test_pretty_matches_stdlib_indent(self, backend):
+        obj = {"graph": {"main": ["helper"]}, "count": 1}
+        assert jsonio.dumps(obj, pretty=True) == json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def test_compact_roundtrip(self, backend):
+        obj = {"a": ["b", "c"], "n": 1.5}
+        text = jsonio.dumps(obj)
+        assert " " not in text
+        assert jsonio.loads(text) == obj
+
+    def test_bytes_roundtrip(self, backend):
+        obj = {"key": "abc:1.0", "version": 2}
+        data = jsonio.dumps_bytes(obj)
+        assert isinstance(data, bytes)
+        assert jsonio.loads(data) == obj
+
+    def test_non_ascii_is_not_escaped(self, backend):
+        obj = {"name": "café"}
+        assert jsonio.dumps(obj) == '{"name":"café"}'
+        assert jsonio.dumps_bytes(obj) == '{"name":"café"}'.encode()
@@ -1,8 +1,11 @@
 """Tests for shared language utilities — no mocking needed."""
 
 import json
+import os
 
-from claudit.lang import detect_language, load_overrides, LEXER_MAP, EXT_MAP
+from claudit.lang import (
+    detect_language, load_overrides, get_lexer_class, LEXER_MAP, EXT_MAP,
+)
 from pygments.lexers import CLexer, JavaLexer, PythonLexer
 
 
@@ -23,6 +26,24 @@ class TestDetectLanguage:
         (tmp_path / "Util.java").write_text("class Util {}")
         assert detect_language(str(tmp_path)) == "java"
 
+    def test_early_exit_agrees_with_full_scan(self, tmp_path):
+        # Enough files to hit the early-exit checkpoint with a clear leader
+        for i in range(4200):
+            (tmp_path / f"f{i}.c").write_text("")
+        sub = tmp_path / "scripts"
+        sub.mkdir()
+        for i in range(40):
+            (sub / f"s{i}.py").write_text("")
+        assert detect_language(str(tmp_path)) == "c"
+
+    def test_close_race_scans_everything(self, tmp_path):
+        # No clear leader at the checkpoint, so the walk must finish
+        for i in range(2100):
+            (tmp_path / f"f{i}.c").write_text("")
+        for i in range(2200):
+            (tmp_path / f"m{i}.py").write_text("")
+        assert detect_language(str(tmp_path)) == "python"
+
     def test_empty_defaults_to_c(self, tmp_path):
         assert detect_language(str(tmp_path)) == "c"
 
@@ -33,6 +54,22 @@ class TestDetectLanguage:
         (tmp_path / "d.c").write_text("")
         assert detect_language(str(tmp_path)) == "python"
 
+    def test_counts_nested_directories(self, tmp_path):
+        (tmp_path / "a.c").write_text("")
+        pkg = tmp_path / "pkg" / "sub"
+        pkg.mkdir(parents=True)
+        (pkg / "x.py").write_text("")
+        (pkg / "y.py").write_text("")
+        assert detect_language(str(tmp_path)) == "python"
+
+    def test_memoized_per_project(self, tmp_path):
+        (tmp_path / "a.c").write_text("")
+        assert detect_language(str(tmp_path)) == "c"
+        for name in ("x.py", "y.py"):
+            (tmp_path / name).write_text("")
+        # Same resolved path, so the first walk's answer is reused
+        assert detect_language(str(tmp_path / ".")) == "c"
+
 
 class TestLoadOverrides:
     def test_none_returns_none(self):
@@ -47,6 +84,15 @@ class TestLoadOverrides:
         result = load_overrides(str(f))
         assert result == {"foo": ["bar", "baz"]}
 
+    def test_reloads_after_edit(self, tmp_path):
+        f = tmp_path / "overrides.json"
+        f.write_text(json.dumps({"foo": ["bar"]}))
+        assert load_overrides(str(f)) == {"foo": ["bar"]}
+        f.write_text(json.dumps({"foo": ["baz"]}))
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_overrides(str(f)) == {"foo": ["baz"]}
+
     def test_rejects_non_dict(self, tmp_path):
         f = tmp_path / "bad.json"
         f.write_text(json.dumps(["not", "a", "dict"]))
@@ -58,6 +104,9 @@ class TestLexerMap:
         assert set(LEXER_MAP) == {"c", "java", "python"}
 
     def test_lexers_are_correct_types(self):
-        assert LEXER_MAP["c"] is CLexer
-        assert LEXER_MAP["java"] is JavaLexer
-        assert LEXER_MAP["python"] is PythonLexer
+        assert get_lexer_class("c") is CLexer
+        assert get_lexer_class("java") is JavaLexer
+        assert get_lexer_class("python") is PythonLexer
+
+    def test_unknown_language_has_no_lexer(self):
+        assert get_lexer_class("rust") is None
@@ -22,7 +22,7 @@ class TestFindWithCachedGraph:
 
         with patch("claudit.skills.path.load_call_graph", return_value=graph), \
              patch("claudit.skills.path.load_overrides", return_value=None), \
-             patch("claudit.skills.path.pathfinder.find_definition", return_value=[]):
+             patch("claudit.skills.path.pathfinder.find_definitions", return_value={}):
             result = find("/project", "main", "helper", annotate=True)
 
         assert result["source"] == "main"
@@ -36,7 +36,7 @@ class TestFindWithCachedGraph:
 
         with patch("claudit.skills.path.load_call_graph", return_value=graph), \
              patch("claudit.skills.path.load_overrides", return_value=None), \
-             patch("claudit.skills.path.pathfinder.find_definition", return_value=[]):
+             patch("claudit.skills.path.pathfinder.find_definitions", return_value={}):
             result = find("/project", "main", "helper", annotate=True)
 
         assert result["path_count"] == 1
@@ -72,12 +72,9 @@ class TestFindWithCachedGraph:
         defs = {"foo": [FunctionDef(name="foo", file="main.c", line=10)],
                 "bar": [FunctionDef(name="bar", file="util.c", line=5)]}
 
-        def mock_find_def(name, proj):
-            return defs.get(name, [])
-
         with patch("claudit.skills.path.load_call_graph", return_value=graph), \
              patch("claudit.skills.path.load_overrides", return_value=None), \
-             patch("claudit.skills.path.pathfinder.find_definition", side_effect=mock_find_def), \
+             patch("claudit.skills.path.pathfinder.find_definitions", return_value=defs), \
              patch("claudit.skills.path.pathfinder._read_line", return_value="void foo() {"):
             result = find("/project", "foo", "bar", annotate=True)
 
@@ -97,6 +94,21 @@ class TestFindWithCachedGraph:
 
         assert result["path_count"] == 0
 
+    def test_cached_paths_skip_search(self):
+        """A cached result for the same query is returned without a BFS."""
+        graph = {"a": ["b"]}
+
+        with patch("claudit.skills.path.load_call_graph", return_value=graph), \
+             patch("claudit.skills.path.load_paths", return_value=[["a", "x", "b"]]), \
+             patch("claudit.skills.path.save_paths") as mock_save, \
+             patch("claudit.skills.path.find_all_paths") as mock_bfs, \
+             patch("claudit.skills.path.load_overrides", return_value=None):
+            result = find("/project", "a", "b", annotate=False)
+
+        mock_bfs.assert_not_called()
+        mock_save.assert_not_called()
+        assert result["paths"][0]["hops"] == ["a", "x", "b"]
+
 
 class TestFindWithGraphBuilding:
     """Test find() when the graph must be built."""
@@ -108,7 +120,7 @@ class TestFindWithGraphBuilding:
         with patch("claudit.skills.path.load_call_graph", side_effect=[None, built_graph]), \
              patch("claudit.skills.path.load_overrides", return_value=None), \
              patch("claudit.skills.path.build_graph") as mock_build, \
-             patch("claudit.skills.path.pathfinder.find_definition", return_value=[]):
+             patch("claudit.skills.path.pathfinder.find_definitions", return_value={}):
             result = find("/project", "main", "target", annotate=True)
 
         mock_build.assert_called_once()
@@ -130,7 +142,7 @@ class TestFindWithGraphBuilding:
         with patch("claudit.skills.path.load_call_graph", side_effect=[graph, graph]), \
              patch("claudit.skills.path.load_overrides", return_value=overrides), \
              patch("claudit.skills.path.build_graph") as mock_build, \
-             patch("claudit.skills.path.pathfinder.find_definition", return_value=[]):
+             patch("claudit.skills.path.pathfinder.find_definitions", return_value={}):
             result = find("/project", "main", "target", overrides_path="/overrides.json")
 
         mock_build.assert_called_once()
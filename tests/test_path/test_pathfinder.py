@@ -3,9 +3,11 @@
 from unittest.mock import patch
 
 from claudit.skills.index.indexer import FunctionDef
+from claudit.skills.graph.callgraph import reverse_call_graph
 from claudit.skills.path.pathfinder import (
     find_all_paths,
     annotate_path,
+    annotate_paths,
     _read_line,
 )
 
@@ -50,6 +52,24 @@ def test_max_depth_limit():
     assert find_all_paths(graph, "a", "e", max_depth=5) == [["a", "b", "c", "d", "e"]]
 
 
+def test_max_depth_boundary_with_dead_ends():
+    # "x" branches into a large subgraph that never reaches the target
+    graph = {"a": ["x", "b"], "b": ["c"], "c": ["d"], "d": ["e"]}
+    graph["x"] = [f"x{i}" for i in range(50)]
+    callers = reverse_call_graph(graph)
+    for kwargs in ({}, {"callers": callers}):
+        assert find_all_paths(graph, "a", "e", max_depth=4, **kwargs) == [["a", "b", "c", "d", "e"]]
+        assert find_all_paths(graph, "a", "e", max_depth=3, **kwargs) == []
+
+
+def test_callers_prune_without_changing_results():
+    graph = {"a": ["b", "c", "x"], "b": ["d", "a"], "c": ["d"], "d": ["e"], "x": ["y"]}
+    callers = reverse_call_graph(graph)
+    for depth in range(6):
+        assert find_all_paths(graph, "a", "e", depth, callers=callers) == \
+            find_all_paths(graph, "a", "e", depth)
+
+
 def test_empty_graph():
     assert find_all_paths({}, "a", "b") == []
 
@@ -61,12 +81,12 @@ def test_diamond_graph():
 
 
 # ---------------------------------------------------------------------------
-# annotate_path — needs mocked Global for find_definition
+# annotate_path — needs mocked Global for find_definitions
 # ---------------------------------------------------------------------------
 class TestAnnotatePath:
     def test_annotates_with_definition(self):
         defs = [FunctionDef(name="foo", file="main.c", line=10)]
-        with patch("claudit.skills.path.pathfinder.find_definition", return_value=defs), \
+        with patch("claudit.skills.path.pathfinder.find_definitions", return_value={"foo": defs}), \
              patch("claudit.skills.path.pathfinder._read_line", return_value="void foo() {"):
             cp = annotate_path(["foo"], "/proj")
         assert len(cp.hops) == 1
@@ -75,12 +95,28 @@ class TestAnnotatePath:
         assert cp.hops[0].line == 10
 
     def test_unknown_function(self):
-        with patch("claudit.skills.path.pathfinder.find_definition", return_value=[]):
+        with patch("claudit.skills.path.pathfinder.find_definitions", return_value={}):
             cp = annotate_path(["unknown_func"], "/proj")
         assert cp.hops[0].file == "<unknown>"
         assert cp.hops[0].line == 0
 
 
+class TestAnnotatePaths:
+    def test_one_lookup_for_shared_hops(self):
+        defs = {
+            "main": [FunctionDef(name="main", file="main.c", line=1)],
+            "sink": [FunctionDef(name="sink", file="util.c", line=7)],
+        }
+        with patch("claudit.skills.path.pathfinder.find_definitions", return_value=defs) as mock_defs, \
+             patch("claudit.skills.path.pathfinder._read_line", return_value="") as mock_read:
+            cps = annotate_paths([["main", "a", "sink"], ["main", "b", "sink"]], "/proj")
+        mock_defs.assert_called_once()
+        assert mock_read.call_count == 2
+        assert [h.function for h in cps[1].hops] == ["main", "b", "sink"]
+        assert cps[1].hops[1].file == "<unknown>"
+        assert cps[0].hops[2].line == 7
+
+
 # ---------------------------------------------------------------------------
 # _read_line — real file I/O, no mocking needed
 # ---------------------------------------------------------------------------